@@ -11,7 +11,13 @@ import pyqtgraph as pg
 from pyqtgraph.Qt import QtWidgets, QtCore, QtGui
 import numpy as np
 import re
+import mmap
+import math
+import operator
+import itertools
+import hashlib
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import traceback
 
 # Optional serial import
@@ -23,6 +29,14 @@ try:
 except ImportError:
     SERIAL_AVAILABLE = False
 
+# Optional fast JSON backend
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Enable OpenGL for better performance
 try:
     import OpenGL.GL as gl
@@ -43,10 +57,33 @@ except ImportError:
 
 try:
     import openpyxl
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+    from openpyxl.utils import get_column_letter
+    from openpyxl.xml import LXML as OPENPYXL_LXML
 
     OPENPYXL_AVAILABLE = True
 except ImportError:
     OPENPYXL_AVAILABLE = False
+    OPENPYXL_LXML = False
+
+try:
+    import xlsxwriter
+
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
+# Analysis Excel export writes directly with xlsxwriter, or with a write-only openpyxl workbook
+EXCEL_EXPORT_AVAILABLE = XLSXWRITER_AVAILABLE or OPENPYXL_AVAILABLE
+
+# Optional JIT for the single-pass device statistics
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 # Compatibility for pen style
 try:
@@ -58,6 +95,9 @@ except AttributeError:
 DEVICES = ["GSE-1", "GSE-2", "TE-R", "TE-1", "TE-2", "TE-3"]
 DATA_TYPES = ["volt", "curr", "pow", "stat"]
 
+# Every "<device>_<data_type>" field name a data point can carry
+FIELD_KEYS = tuple(f"{device}_{data_type}" for device in DEVICES for data_type in DATA_TYPES)
+
 # Device name mapping for Teensy commands (display name -> command name)
 DEVICE_COMMAND_MAP = {
     "GSE-1": "gse1",
@@ -79,6 +119,13 @@ DEFAULT_DEVICE_COLORS = {
     'stat': [(214, 39, 40), (148, 103, 189), (140, 86, 75), (31, 119, 180), (255, 127, 14), (44, 160, 44)]
 }
 
+# Per-type line colors on the individual device tabs
+DEVICE_PLOT_COLORS = [(31, 119, 180), (255, 127, 14), (44, 160, 44), (214, 39, 40)]
+
+# Per-device analysis fields reduced into the system summary (column order of the stats table)
+SUMMARY_STAT_FIELDS = ("Max Voltage (V)", "Average Voltage (V)", "Max Current (A)", "Average Current (A)",
+                       "Max Power (W)", "Average Power (W)", "Calculated Amp Hours (Ah)", "Energy Consumed (Wh)")
+
 # FIXED: Better default Y-axis ranges
 DEFAULT_Y_RANGES = {
     'volt': (0, 35),  # 0-35V range
@@ -87,6 +134,65 @@ DEFAULT_Y_RANGES = {
     'stat': (-0.1, 1.1)  # Status range with padding
 }
 
+# Patterns used to detect and repair truncated/corrupted JSON files
+TRAILING_COMMA_RE = re.compile(r',(\s*[}\]])')
+TRUNCATED_TAIL_RE = re.compile(r'[,{]\s*$')
+
+# Files at least this large are memory-mapped instead of read into memory
+MMAP_MIN_BYTES = 256 * 1024
+
+# Worker pool for NumPy reductions that release the GIL (curve range preparation)
+WORKER_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 4)
+# Below this many total samples, preparing curves inline is cheaper than dispatching
+PARALLEL_MIN_POINTS = 200_000
+
+# Crosshair handlers run at most once per interval; newer mouse positions replace queued ones
+CROSSHAIR_THROTTLE_MS = 33
+# One colored "name: value" row of the crosshair label
+CROSSHAIR_LINE_TEMPLATE = "<span style='color: {c}'>{n}: {v:.3f}</span><br>"
+
+# QSettings group holding the main window layout and connection fields
+UI_SETTINGS_GROUP = "ui"
+UI_SETTINGS_KEYS = ("window_size", "window_position", "splitter_sizes", "tcp_ip", "tcp_port", "udp_port")
+
+# Analysis workbook column widths by header, set once per column
+EXCEL_COLUMN_WIDTHS = {"Category": 20, "Parameter": 32, "Value": 48}
+
+if NUMBA_AVAILABLE:
+    @njit
+    def _device_stats_kernel(v, c, t):
+        """Voltage/current/power max, min, sum and trapezoid integrals over seconds in one sweep"""
+        vmax = vmin = vsum = v[0]
+        cmax = cmin = csum = c[0]
+        p_prev = v[0] * c[0]
+        pmax = pmin = psum = p_prev
+        amp_sec = watt_sec = 0.0
+        for i in range(1, v.shape[0]):
+            vi = v[i]
+            ci = c[i]
+            pi = vi * ci
+            vmax = max(vmax, vi)
+            vmin = min(vmin, vi)
+            cmax = max(cmax, ci)
+            cmin = min(cmin, ci)
+            pmax = max(pmax, pi)
+            pmin = min(pmin, pi)
+            vsum += vi
+            csum += ci
+            psum += pi
+            dt = t[i] - t[i - 1]
+            amp_sec += 0.5 * (ci + c[i - 1]) * dt
+            watt_sec += 0.5 * (pi + p_prev) * dt
+            p_prev = pi
+        # max()/min() skip NaN in this loop; NaN still reaches the sums, so propagate it like NumPy does
+        if vsum != vsum:
+            vmax = vmin = vsum
+        if csum != csum:
+            cmax = cmin = csum
+        if psum != psum:
+            pmax = pmin = psum
+        return vmax, vmin, vsum, cmax, cmin, csum, pmax, pmin, psum, amp_sec, watt_sec
+
 
 class DebugConsole(QtWidgets.QDialog):
     """Debug console for monitoring and sending commands"""
@@ -681,14 +787,19 @@ class TeensyController(QtCore.QObject):
 
         return False
 
+    def _encode_command(self, command_dict):
+        """Serialize a command dict to UTF-8 JSON bytes"""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(command_dict)
+        return json.dumps(command_dict).encode('utf-8')
+
     def _send_tcp_command(self, command_dict):
         """Send command via TCP"""
         if not self.tcp_socket:
             return False
 
         try:
-            json_str = json.dumps(command_dict) + '\n'
-            self.tcp_socket.send(json_str.encode('utf-8'))
+            self.tcp_socket.send(self._encode_command(command_dict) + b'\n')
             return True
         except Exception as e:
             self.error_occurred.emit(f"TCP send failed: {str(e)}")
@@ -700,8 +811,7 @@ class TeensyController(QtCore.QObject):
             return False
 
         try:
-            json_str = json.dumps(command_dict)
-            self.udp_socket.sendto(json_str.encode('utf-8'), (self.udp_ip, self.udp_port))
+            self.udp_socket.sendto(self._encode_command(command_dict), (self.udp_ip, self.udp_port))
             return True
         except Exception as e:
             self.error_occurred.emit(f"UDP send failed: {str(e)}")
@@ -713,9 +823,9 @@ class TeensyController(QtCore.QObject):
             return False
 
         try:
-            json_str = json.dumps(command_dict) + '\n'
-            print(f"Sending serial command: {json_str.strip()}")
-            self.serial_port.write(json_str.encode('utf-8'))
+            payload = self._encode_command(command_dict)
+            print(f"Sending serial command: {payload.decode('utf-8')}")
+            self.serial_port.write(payload + b'\n')
             self.serial_port.flush()
             return True
         except Exception as e:
@@ -777,13 +887,14 @@ class TeensyController(QtCore.QObject):
     def _process_received_data(self, json_str):
         """Process received JSON data"""
         try:
-            # Try to parse as JSON
-            data = json.loads(json_str)
+            # Try to parse as JSON (orjson raises a json.JSONDecodeError subclass)
+            data = orjson.loads(json_str) if ORJSON_AVAILABLE else json.loads(json_str)
 
             # Route data based on type
             data_type = data.get('type', '')
 
             if data_type == 'live_data':
+                self._normalize_live_data(data)
                 self.data_received.emit(data)
             elif data_type == 'status':
                 self.status_received.emit(data)
@@ -803,6 +914,24 @@ class TeensyController(QtCore.QObject):
         except json.JSONDecodeError:
             print(f"Non-JSON response: {json_str}")
 
+    def _normalize_live_data(self, data):
+        """Coerce live_data device entries once so GUI handlers can index them directly"""
+        devices = data.get('devices')
+        normalized = []
+        if isinstance(devices, list):
+            for device in devices:
+                if not isinstance(device, dict):
+                    continue
+                try:
+                    for key in ('voltage', 'current', 'power'):
+                        value = device.get(key, 0.0)
+                        device[key] = value if type(value) is float else float(value)
+                except (TypeError, ValueError):
+                    continue
+                device['state'] = bool(device.get('state', False))
+                normalized.append(device)
+        data['devices'] = normalized
+
     def start_streaming(self, interval=100):
         """Start data streaming"""
         command = {"cmd": "start_stream", "interval": interval}
@@ -892,9 +1021,64 @@ class TeensyController(QtCore.QObject):
         return self.send_command(command)
 
 
+class ExportWorkerSignals(QtCore.QObject):
+    """Signals emitted by ExportWorker"""
+
+    finished = QtCore.Signal(str)  # File path
+    failed = QtCore.Signal(str)  # Error message
+
+
+class ExportWorker(QtCore.QRunnable):
+    """Writes an analysis report off the GUI thread"""
+
+    def __init__(self, write_report, analysis_data, file_path):
+        super().__init__()
+        self.write_report = write_report
+        self.analysis_data = analysis_data
+        self.file_path = file_path
+        self.signals = ExportWorkerSignals()
+
+    def run(self):
+        """Write the report and signal the outcome"""
+        try:
+            self.write_report(self.analysis_data, self.file_path)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(self.file_path)
+
+
+class SettingsWriter(QtCore.QRunnable):
+    """Writes changed settings to QSettings off the GUI thread"""
+
+    def __init__(self, organization, application, group, changes):
+        super().__init__()
+        self.organization = organization
+        self.application = application
+        self.group = group
+        self.changes = changes
+
+    def run(self):
+        """Persist the changed values with a single sync"""
+        # QSettings is reentrant, not thread-safe, so the writer uses its own instance
+        settings = QtCore.QSettings(self.organization, self.application)
+        settings.beginGroup(self.group)
+        for key, value in self.changes.items():
+            settings.setValue(key, value)
+        settings.endGroup()
+        settings.sync()
+
+
 class PowerControllerGUI(QtWidgets.QMainWindow):
     """Main application class for Teensy 4.1 Power Controller GUI with FIXED smooth plotting"""
 
+    # Button stylesheets, shared so Qt does not get a new string to parse on every update
+    _QSS_ON = "QPushButton { background-color: #51cf66; color: white; font-weight: bold; }"
+    _QSS_OFF = "QPushButton { background-color: #ff6b6b; color: white; font-weight: bold; }"
+    _QSS_LOCKED = "QPushButton { background-color: #ff6b6b; color: white; font-weight: bold; min-height: 35px; }"
+    _QSS_STOPPED = "QPushButton { background-color: #ff4444; color: white; font-weight: bold; min-height: 35px; }"
+    _QSS_SYSTEM_NORMAL = "QPushButton { min-height: 35px; font-weight: bold; }"
+
     def __init__(self):
         super().__init__()
 
@@ -902,19 +1086,24 @@ class PowerControllerGUI(QtWidgets.QMainWindow):
         self.current_file_path = None
         self.data_json = None
         self.data_points = []
-        self.times = []
+        self.times = np.empty(0, dtype=np.float64)
         self.channels = {}
+        self._data_version = 0  # Bumped whenever the analysed data changes
+        self._analysis_cache = None
+        self._analysis_cache_key = None
 
         # FIXED: Enhanced live data system with smooth updates
         self.live_data_points = deque()
-        self.live_times = deque()
-        self.live_channels = {}
+        self._reset_live_buffers()
 
         # NEW: Smooth update system
         self.plot_initialized = False
         self.data_buffer = deque(maxlen=50)  # Buffer for smooth updates
         self.last_plot_update = 0
         self.plot_curves_cache = {}  # Cache for plot curves
+        self._last_plotted = {}  # curve_key -> (curve, length, last x) of the last setData
+        self._plot_structure_key = None  # Layout the current tab's plots were built for
+        self._crosshair_data = {}  # Crosshair owner ('all' or device) -> crosshair lookup state
         self.plot_layout_stable = False  # Track if layout is stable
 
         # Common data structure
@@ -929,6 +1118,10 @@ class PowerControllerGUI(QtWidgets.QMainWindow):
         self.device_controls = {}
         self.current_tab_index = 0
 
+        # Last applied button states, used to skip redundant restyling
+        self._last_toggle_state = {}
+        self._last_system_state = {}
+
         # Teensy controller
         self.teensy = TeensyController()
         self.setup_teensy_signals()
@@ -940,6 +1133,10 @@ class PowerControllerGUI(QtWidgets.QMainWindow):
         self.user_interacting = False
         self.plot_update_pending = False
 
+        # Live info label is rebuilt at most every 500 ms, not per packet
+        self._info_tpl = "<b>Live Data Stream:</b><br>Data Points: {:,}<br>Duration: {:.1f}s<br>Connected: {}"
+        self._last_info_update = QtCore.QElapsedTimer()
+
         # System status
         self.system_status = {}
         self.available_scripts = []
@@ -951,11 +1148,37 @@ class PowerControllerGUI(QtWidgets.QMainWindow):
 
         # Crosshair management
         self.crosshair_items = {}
+        self._export_workers = set()  # Running ExportWorkers, kept alive until they report back
+        self._last_export_hash = {}  # Excel file path -> (content hash, mtime) of the last workbook written there
+        self._lxml_warning_shown = False
+        self._closing = False  # Set once closeEvent starts shutting down
+        self._crosshair_connections = []  # (signal, slot, throttle timer or None) connected for crosshairs
 
         # Settings
         self.settings = QtCore.QSettings("TeensyPowerController", "TeensyPowerController")
         self.max_recent_files = 10
 
+        # Window layout and connection fields live in the "ui" group, read in one pass;
+        # load/save_settings work on this copy and closeEvent writes back the changes
+        self.settings.beginGroup(UI_SETTINGS_GROUP)
+        self._settings_cache = {key: self._read_ui_setting(key) for key in self.settings.childKeys()}
+        self.settings.endGroup()
+        if not self._settings_cache:
+            # Move values saved before the group existed into it and drop the old top-level keys
+            for key in UI_SETTINGS_KEYS:
+                if self.settings.contains(key):
+                    self._settings_cache[key] = self._read_ui_setting(key)
+                    self.settings.setValue(f"{UI_SETTINGS_GROUP}/{key}", self._settings_cache[key])
+                    self.settings.remove(key)
+        self._settings_saved = dict(self._settings_cache)
+
+        # Settings read on stream-rate paths, refreshed whenever settings change
+        self._cached_settings = {}
+        self._reload_settings()
+
+        # Per (device, data_type) colors, Y-ranges and labels used when building plots
+        self._build_lookup_tables()
+
         # Analysis update timer
         self.analysis_timer = QtCore.QTimer()
         self.analysis_timer.timeout.connect(self.update_side_panel_for_current_tab)
@@ -968,6 +1191,7 @@ class PowerControllerGUI(QtWidgets.QMainWindow):
 
         # Debug console
         self.debug_console = None
+        self.verbose_errors = False  # Full tracebacks, enabled with the debug console
 
         self.init_ui()
         self.create_menus()
@@ -1348,6 +1572,39 @@ class PowerControllerGUI(QtWidgets.QMainWindow):
         }
         return type_mapping.get(data_type, f"{device_formatted} {data_type.title()}")
 
+    def _reload_settings(self):
+        """Refresh the cached copies of settings used on hot paths"""
+        value = self.settings.value
+        self._cached_settings = {
+            'data_mode': value("data_mode", 0, int),
+            'polling_rate': value("polling_rate", 1000, int),
+            'max_points': value("max_points", 10000, int),
+            'moving_avg_window': value("moving_avg_window", 5, int),
+            'enable_filtering': value("enable_filtering", False, bool),
+            'enable_interpolation': value("enable_interpolation", False, bool),
+            'line_thickness': value("line_thickness", 2, int),
+            'show_grid': value("show_grid", True, bool),
+            'auto_resize': value("auto_resize", True, bool),
+            'enable_crosshair': value("enable_crosshair", True, bool),
+            'show_crosshair_label': value("show_crosshair_label", True, bool),
+            'window_mode': value("window_mode", 0, int),
+            'window_max_points': value("window_max_points", -1, int),
+            'sliding_window_time': value("sliding_window_time", 10.0, float),
+        }
+        self.max_live_points = self._cached_settings['max_points']
+
+    def _build_lookup_tables(self):
+        """Precompute plot colors, Y-ranges and labels for every device and data type"""
+        self._color_table = {}
+        self._y_range_table = {}
+        for d in self.devices:
+            for t in DATA_TYPES:
+                self.get_device_color(d, t)
+        for t in DATA_TYPES:
+            self.get_y_range_for_type(t)
+        self._type_name_table = {t: self.format_type_name(t) for t in DATA_TYPES}
+        self._axis_label_table = {(d, t): self.format_axis_label(d, t) for d in self.devices for t in DATA_TYPES}
+
     def create_toggle_button(self):
         """Create the toggle side panel button"""
         self.toggleSidePanelBtn = QtWidgets.QPushButton()
@@ -1423,7 +1680,9 @@ class PowerControllerGUI(QtWidgets.QMainWindow):
 
         # Recent Files
         self.recent_menu = file_menu.addMenu('&Recent Files')
-        self.update_recent_files_menu()
+        # Existence checks happen when the menu is opened, not at startup or on every file load
+        self.update_recent_files_menu(check_exists=False)
+        self.recent_menu.aboutToShow.connect(self.update_recent_files_menu)
 
         file_menu.addSeparator()
 
@@ -1457,7 +1716,7 @@ class PowerControllerGUI(QtWidgets.QMainWindow):
         export_menu.addAction(export_csv_action)
 
         # Export to Excel (if available)
-        if PANDAS_AVAILABLE and OPENPYXL_AVAILABLE:
+        if EXCEL_EXPORT_AVAILABLE:
             export_excel_action = QtGui.QAction('Export to &Excel...', self)
             export_excel_action.setStatusTip('Export analysis to Excel file')
             export_excel_action.triggered.connect(lambda: self.export_analysis('excel'))
@@ -1533,17 +1792,21 @@ class PowerControllerGUI(QtWidgets.QMainWindow):
 
     def apply_new_settings(self):
         """Apply new settings from dialog"""
-        self.max_live_points = self.settings.value("max_points", 10000, int)
+        self._reload_settings()
+        self._data_version += 1
         self.analysis_timer.setInterval(self.settings.value("analysis_update_rate", 2000, int))
         self.auto_resize_cb.setChecked(self.settings.value("auto_resize", True, bool))
         self.crosshair_cb.setChecked(self.settings.value("enable_crosshair", True, bool))
         self.baud_combo.setCurrentText(self.settings.value("serial_baud_rate", "2000000"))
+        self._build_lookup_tables()
+        self._plot_structure_key = None
         self.schedule_plot_update()
 
     def show_debug_console(self):
         """Show debug console"""
         if self.debug_console is None:
             self.debug_console = DebugConsole(self, self.teensy)
+            self.verbose_errors = True
         self.debug_console.show()
         self.debug_console.raise_()
 
@@ -1574,7 +1837,7 @@ class PowerControllerGUI(QtWidgets.QMainWindow):
     def export_live_data_json(self, file_path):
         """Export live data to JSON format"""
         data_to_export = list(self.live_data_points) if self.live_mode else self.data_points
-        times_to_export = list(self.live_times) if self.live_mode else self.times
+        times_to_export = self.live_times if self.live_mode else self.times
 
         export_data = {
             'timestamp': datetime.now().isoformat(),
@@ -1582,8 +1845,12 @@ class PowerControllerGUI(QtWidgets.QMainWindow):
             'data': data_to_export
         }
 
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2)
+        if ORJSON_AVAILABLE:
+            with open(file_path, 'wb') as f:
+                f.write(orjson.dumps(export_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(file_path, 'w', encoding='utf-8') as f:
+                json.dump(export_data, f, indent=2)
 
     def export_live_data_csv(self, file_path):
         """Export live data to CSV format"""
@@ -1605,40 +1872,68 @@ class PowerControllerGUI(QtWidgets.QMainWindow):
             raise Exception("Excel export requires pandas library")
 
         data_to_export = list(self.live_data_points) if self.live_mode else self.data_points
-        df = pd.DataFrame(data_to_export)
+        # Fill a 2-D object array column by column so pandas skips its list-of-dicts row inference;
+        # columns are the union of all keys in first-seen order, as the list-of-dicts constructor used
+        columns = list(dict.fromkeys(itertools.chain.from_iterable(data_to_export)))
+        values = np.empty((len(data_to_export), len(columns)), dtype=object)
+        for j, column in enumerate(columns):
+            values[:, j] = [point.get(column) for point in data_to_export]
+        df = pd.DataFrame(values, columns=columns, copy=False)
         df.to_excel(file_path, index=False)
 
     def apply_data_filtering(self, data_array):
         """Apply data filtering based on settings"""
-        if not self.settings.value("enable_filtering", False, bool):
+        if not self._cached_settings['enable_filtering']:
             return data_array
 
         filtered_data = np.array(data_array)
 
         # Moving average
-        window = self.settings.value("moving_avg_window", 5, int)
+        window = self._cached_settings['moving_avg_window']
         if window > 1 and len(filtered_data) >= window:
             filtered_data = np.convolve(filtered_data, np.ones(window) / window, mode='same')
 
         # Interpolation for missing values
-        if self.settings.value("enable_interpolation", False, bool):
+        if self._cached_settings['enable_interpolation']:
             mask = np.isfinite(filtered_data)
             if np.any(~mask) and np.any(mask):
                 indices = np.arange(len(filtered_data))
                 filtered_data[~mask] = np.interp(indices[~mask], indices[mask], filtered_data[mask])
 
+        if isinstance(data_array, np.ndarray):
+            return filtered_data.astype(data_array.dtype, copy=False)
         return filtered_data.tolist()
 
     def on_auto_resize_changed(self):
         """Handle auto-resize setting change"""
         self.settings.setValue("auto_resize", self.auto_resize_cb.isChecked())
+        self._cached_settings['auto_resize'] = self.auto_resize_cb.isChecked()
 
     def on_crosshair_changed(self):
         """Handle crosshair toggle change"""
         enabled = self.crosshair_cb.isChecked()
         self.settings.setValue("enable_crosshair", enabled)
+        self._cached_settings['enable_crosshair'] = enabled
+        self.toggle_crosshair(enabled)
+
+    def toggle_crosshair(self, enabled):
+        """Install or remove the current tab's crosshair without rebuilding its plots"""
+        # Clearing also disconnects the mouse handlers, so a disabled crosshair costs nothing per event
         self.clear_crosshairs()
-        self.schedule_plot_update()
+        if not enabled:
+            return
+
+        selected_types = self.get_selected_types()
+        times, channels = self.get_current_data()
+        if not selected_types or len(times) == 0:
+            return
+
+        current_tab = self.plotTabWidget.currentIndex()
+        if current_tab == 0:
+            self.add_crosshair_to_all_plot(times, channels, selected_types)
+        elif 0 < current_tab <= len(self.devices):
+            self.add_crosshair_to_device_plot(self.devices[current_tab - 1], times, channels,
+                                              selected_types, DEVICE_PLOT_COLORS)
 
     def clear_crosshairs(self):
         """Clear all crosshair items from plots"""
@@ -1652,6 +1947,52 @@ class PowerControllerGUI(QtWidgets.QMainWindow):
                         pass
         self.crosshair_items.clear()
 
+        for signal, slot, timer in self._crosshair_connections:
+            if timer is not None:
+                timer.stop()
+            try:
+                signal.disconnect(slot)
+            except (TypeError, RuntimeError):
+                pass
+        self._crosshair_connections.clear()
+
+    def _connect_crosshair(self, scene, handler):
+        """Feed scene mouse moves to a crosshair handler, throttled with leading and trailing calls"""
+        timer = QtCore.QTimer()
+        timer.setSingleShot(True)
+        timer.setInterval(CROSSHAIR_THROTTLE_MS)
+        pending = []
+
+        def flush():
+            if pending:
+                pos = pending.pop()
+                handler(pos)
+                timer.start()
+
+        def on_mouse_moved(pos):
+            pending[:] = [pos]
+            if not timer.isActive():
+                flush()
+
+        timer.timeout.connect(flush)
+        scene.sigMouseMoved.connect(on_mouse_moved)
+        self._crosshair_connections.append((scene.sigMouseMoved, on_mouse_moved, timer))
+
+    def _crosshair_label_bounds(self, plot):
+        """Crosshair label placement limits for a plot, recomputed only when its view range changes"""
+        bounds = {}
+
+        def on_range_changed(*args):
+            (x_min, x_max), (y_min, y_max) = plot.viewRange()
+            bounds['x_offset'] = (x_max - x_min) * 0.02
+            bounds['x_max'] = x_max - (x_max - x_min) * 0.3
+            bounds['y_min'] = y_min + (y_max - y_min) * 0.1
+
+        on_range_changed()
+        plot.sigRangeChanged.connect(on_range_changed)
+        self._crosshair_connections.append((plot.sigRangeChanged, on_range_changed, None))
+        return bounds
+
     def schedule_plot_update(self):
         """Schedule a plot update"""
         if not self.plot_update_pending:
@@ -1753,13 +2094,47 @@ class PowerControllerGUI(QtWidgets.QMainWindow):
             success = self.teensy.set_output(device, state)
             print(f"Toggle {device} to {state}, success: {success}")
 
+        self.set_device_toggle_state(device, state)
+
+    def set_device_toggle_state(self, device, state):
+        """Update a device toggle button, skipping the restyle when the state is unchanged"""
+        state = bool(state)
+        if self._last_toggle_state.get(device) == state:
+            return
+        self._last_toggle_state[device] = state
+
         button = self.device_controls[device]['toggle']
-        if state:
-            button.setText("ON")
-            button.setStyleSheet("QPushButton { background-color: #51cf66; color: white; font-weight: bold; }")
-        else:
-            button.setText("OFF")
-            button.setStyleSheet("QPushButton { background-color: #ff6b6b; color: white; font-weight: bold; }")
+        button.blockSignals(True)
+        button.setChecked(state)
+        button.setText("ON" if state else "OFF")
+        button.setStyleSheet(self._QSS_ON if state else self._QSS_OFF)
+        button.blockSignals(False)
+
+    def set_lock_button_state(self, locked):
+        """Update the lock button, skipping the restyle when the state is unchanged"""
+        locked = bool(locked)
+        if self._last_system_state.get('locked') == locked:
+            return
+        self._last_system_state['locked'] = locked
+
+        self.lock_btn.blockSignals(True)
+        self.lock_btn.setChecked(locked)
+        self.lock_btn.setText("LOCKED" if locked else "UNLOCK")
+        self.lock_btn.setStyleSheet(self._QSS_LOCKED if locked else self._QSS_SYSTEM_NORMAL)
+        self.lock_btn.blockSignals(False)
+
+    def set_safety_button_state(self, stopped):
+        """Update the safety stop button, skipping the restyle when the state is unchanged"""
+        stopped = bool(stopped)
+        if self._last_system_state.get('safety_stop') == stopped:
+            return
+        self._last_system_state['safety_stop'] = stopped
+
+        self.safety_btn.blockSignals(True)
+        self.safety_btn.setChecked(stopped)
+        self.safety_btn.setText("STOPPED" if stopped else "NORMAL")
+        self.safety_btn.setStyleSheet(self._QSS_STOPPED if stopped else self._QSS_SYSTEM_NORMAL)
+        self.safety_btn.blockSignals(False)
 
     def toggle_lock(self):
         """Toggle system lock"""
@@ -1767,13 +2142,7 @@ class PowerControllerGUI(QtWidgets.QMainWindow):
         if self.teensy.connected:
             self.teensy.set_lock(state)
 
-        if state:
-            self.lock_btn.setText("LOCKED")
-            self.lock_btn.setStyleSheet(
-                "QPushButton { background-color: #ff6b6b; color: white; font-weight: bold; min-height: 35px; }")
-        else:
-            self.lock_btn.setText("UNLOCK")
-            self.lock_btn.setStyleSheet("QPushButton { min-height: 35px; font-weight: bold; }")
+        self.set_lock_button_state(state)
 
     def toggle_safety_stop(self):
         """Toggle safety stop"""
@@ -1781,19 +2150,13 @@ class PowerControllerGUI(QtWidgets.QMainWindow):
         if self.teensy.connected:
             self.teensy.set_safety_stop(state)
 
-        if state:
-            self.safety_btn.setText("STOPPED")
-            self.safety_btn.setStyleSheet(
-                "QPushButton { background-color: #ff4444; color: white; font-weight: bold; min-height: 35px; }")
-        else:
-            self.safety_btn.setText("NORMAL")
-            self.safety_btn.setStyleSheet("QPushButton { min-height: 35px; font-weight: bold; }")
+        self.set_safety_button_state(state)
 
     def toggle_streaming(self):
         """Toggle data streaming - FIXED to initialize plots"""
         if self.stream_btn.isChecked():
             if self.teensy.connected:
-                interval = self.settings.value("polling_rate", 1000, int)
+                interval = self._cached_settings['polling_rate']
                 if self.teensy.start_streaming(interval):
                     self.stream_btn.setText("Stop Stream")
                     self.live_mode_radio.setChecked(True)
@@ -1816,140 +2179,145 @@ class PowerControllerGUI(QtWidgets.QMainWindow):
                 self.teensy.stop_streaming()
             self.stream_btn.setText("Start Stream")
 
-            def _initialize_streaming_plots(self):
-                """Initialize plots when streaming starts - NEW METHOD"""
-                # Force creation of initial plots with dummy data
-                selected_types = self.get_selected_types()
-                if not selected_types:
-                    return
-
-                current_tab = self.plotTabWidget.currentIndex()
-
-                # Create initial plots structure
-                if current_tab == 0:  # All tab
-                    self.all_plot_widget.clear()
-                    self.plots.clear()
-                    self.curves.clear()
-
-                    line_thickness = self.settings.value("line_thickness", 2, int)
-                    show_grid = self.settings.value("show_grid", True, bool)
-
-                    # Create empty plots for each data type
-                    for i, data_type in enumerate(selected_types):
-                        p = self.all_plot_widget.addPlot(row=i, col=0)
-                        p.setContentsMargins(10, 10, 10, 10)
-                        p.showGrid(y=show_grid, x=show_grid, alpha=0.3)
-                        p.setLabel('left', self.format_type_name(data_type))
-                        if i == len(selected_types) - 1:
-                            p.setLabel('bottom', 'Time (s)')
-
-                        # Set default Y-axis range
-                        if data_type == 'stat':
-                            p.setYRange(-0.1, 1.1, padding=0)
-                        else:
-                            default_range = self.get_y_range_for_type(data_type)
-                            p.setYRange(default_range[0], default_range[1], padding=0)
-
-                        # Set initial X-axis range
-                        p.setXRange(0, 10, padding=0)  # Start with 10 second window
-
-                        # Create empty curves for each device
-                        for j, device in enumerate(self.devices):
-                            color = self.get_device_color(device, data_type)
-                            curve = p.plot(
-                                [],  # Empty data initially
-                                [],
-                                pen=pg.mkPen(color=color, width=line_thickness),
-                                name=device
-                            )
-                            self.curves[f"{device}_{data_type}"] = curve
-
-                        # Add legend to first plot
-                        if i == 0:
-                            legend = p.addLegend(offset=(10, 10))
-                            for device in self.devices:
-                                curve_key = f"{device}_{data_type}"
-                                if curve_key in self.curves:
-                                    curve = self.curves[curve_key]
-                                    legend.addItem(curve, device)
-
-                        # Link x-axes
-                        if i > 0:
-                            first_plot_key = f"all_{selected_types[0]}"
-                            if first_plot_key in self.plots:
-                                p.setXLink(self.plots[first_plot_key])
-
-                        p.enableAutoRange(axis='x', enable=False)
-                        p.enableAutoRange(axis='y', enable=False)
-                        p.sigRangeChanged.connect(self.on_plot_range_changed)
-
-                        self.plots[f"all_{data_type}"] = p
-
-                else:  # Individual device tab
-                    device = self.devices[current_tab - 1]
-                    plot_widget = self.device_plot_widgets[device]
-                    plot_widget.clear()
-
-                    # Clear device-specific plots
-                    keys_to_remove = [k for k in self.plots.keys() if k.startswith(f"{device}_")]
-                    for key in keys_to_remove:
-                        del self.plots[key]
-                    keys_to_remove = [k for k in self.curves.keys() if k.startswith(f"{device}_")]
-                    for key in keys_to_remove:
-                        del self.curves[key]
-
-                    line_thickness = self.settings.value("line_thickness", 2, int)
-                    show_grid = self.settings.value("show_grid", True, bool)
-                    color_pool = [(31, 119, 180), (255, 127, 14), (44, 160, 44), (214, 39, 40)]
-
-                    valid_plots = 0
-                    for i, data_type in enumerate(selected_types):
-                        field_key = f"{device}_{data_type}"
-
-                        p = plot_widget.addPlot(row=valid_plots, col=0)
-                        p.setContentsMargins(10, 10, 10, 10)
-                        p.showGrid(y=show_grid, x=show_grid, alpha=0.3)
-
-                        color = color_pool[valid_plots % len(color_pool)]
-
-                        curve = p.plot(
-                            [],  # Empty data initially
-                            [],
-                            pen=pg.mkPen(color=color, width=line_thickness),
-                            name=field_key
-                        )
-
-                        # Set default ranges
-                        if data_type == 'stat':
-                            p.setYRange(-0.1, 1.1, padding=0)
-                        else:
-                            default_range = self.get_y_range_for_type(data_type)
-                            p.setYRange(default_range[0], default_range[1], padding=0)
+    def _initialize_streaming_plots(self):
+        """Initialize plots when streaming starts - NEW METHOD"""
+        # Force creation of initial plots with dummy data
+        selected_types = self.get_selected_types()
+        if not selected_types:
+            return
+
+        current_tab = self.plotTabWidget.currentIndex()
+
+        # Create initial plots structure
+        self._plot_structure_key = None
+        self.clear_crosshairs()
+        if current_tab == 0:  # All tab
+            self.all_plot_widget.clear()
+            self.plots.clear()
+            self.curves.clear()
+
+            line_thickness = self._cached_settings['line_thickness']
+            show_grid = self._cached_settings['show_grid']
+
+            # Create empty plots for each data type
+            for i, data_type in enumerate(selected_types):
+                p = self.all_plot_widget.addPlot(row=i, col=0)
+                p.setContentsMargins(10, 10, 10, 10)
+                # Draw at most one min/max pair per pixel column, and only the visible range
+                p.setDownsampling(auto=True, mode='peak')
+                p.setClipToView(True)
+                p.showGrid(y=show_grid, x=show_grid, alpha=0.3)
+                p.setLabel('left', self._type_name_table[data_type])
+                if i == len(selected_types) - 1:
+                    p.setLabel('bottom', 'Time (s)')
+
+                # Set default Y-axis range
+                if data_type == 'stat':
+                    p.setYRange(-0.1, 1.1, padding=0)
+                else:
+                    default_range = self._y_range_table[data_type]
+                    p.setYRange(default_range[0], default_range[1], padding=0)
+
+                # Set initial X-axis range
+                p.setXRange(0, 10, padding=0)  # Start with 10 second window
+
+                # Create empty curves for each device
+                for j, device in enumerate(self.devices):
+                    color = self._color_table[(device, data_type)]
+                    curve = p.plot(
+                        [],  # Empty data initially
+                        [],
+                        pen=pg.mkPen(color=color, width=line_thickness),
+                        name=device
+                    )
+                    self.curves[f"{device}_{data_type}"] = curve
+
+                # Add legend to first plot
+                if i == 0:
+                    legend = p.addLegend(offset=(10, 10))
+                    for device in self.devices:
+                        curve_key = f"{device}_{data_type}"
+                        if curve_key in self.curves:
+                            curve = self.curves[curve_key]
+                            legend.addItem(curve, device)
+
+                # Link x-axes
+                if i > 0:
+                    first_plot_key = f"all_{selected_types[0]}"
+                    if first_plot_key in self.plots:
+                        p.setXLink(self.plots[first_plot_key])
+
+                p.enableAutoRange(axis='x', enable=False)
+                p.enableAutoRange(axis='y', enable=False)
+                p.sigRangeChanged.connect(self.on_plot_range_changed)
+
+                self.plots[f"all_{data_type}"] = p
+
+        else:  # Individual device tab
+            device = self.devices[current_tab - 1]
+            plot_widget = self.device_plot_widgets[device]
+            plot_widget.clear()
+
+            # Clear device-specific plots
+            prefix = f"{device}_"
+            self.plots = {k: v for k, v in self.plots.items() if not k.startswith(prefix)}
+            self.curves = {k: v for k, v in self.curves.items() if not k.startswith(prefix)}
 
-                        p.setXRange(0, 10, padding=0)
-                        p.enableAutoRange(axis='x', enable=False)
-                        p.enableAutoRange(axis='y', enable=False)
+            line_thickness = self._cached_settings['line_thickness']
+            show_grid = self._cached_settings['show_grid']
+            color_pool = DEVICE_PLOT_COLORS
+
+            valid_plots = 0
+            first_plot = None
+            for i, data_type in enumerate(selected_types):
+                field_key = f"{device}_{data_type}"
+
+                p = plot_widget.addPlot(row=valid_plots, col=0)
+                p.setContentsMargins(10, 10, 10, 10)
+                # Draw at most one min/max pair per pixel column, and only the visible range
+                p.setDownsampling(auto=True, mode='peak')
+                p.setClipToView(True)
+                p.showGrid(y=show_grid, x=show_grid, alpha=0.3)
+
+                color = color_pool[valid_plots % len(color_pool)]
+
+                curve = p.plot(
+                    [],  # Empty data initially
+                    [],
+                    pen=pg.mkPen(color=color, width=line_thickness),
+                    name=field_key
+                )
+
+                # Set default ranges
+                if data_type == 'stat':
+                    p.setYRange(-0.1, 1.1, padding=0)
+                else:
+                    default_range = self._y_range_table[data_type]
+                    p.setYRange(default_range[0], default_range[1], padding=0)
+
+                p.setXRange(0, 10, padding=0)
+                p.enableAutoRange(axis='x', enable=False)
+                p.enableAutoRange(axis='y', enable=False)
 
-                        p.setLabel('left', self.format_axis_label(device, data_type))
-                        if valid_plots == len(selected_types) - 1:
-                            p.setLabel('bottom', 'Time (s)')
+                p.setLabel('left', self._axis_label_table[(device, data_type)])
+                if valid_plots == len(selected_types) - 1:
+                    p.setLabel('bottom', 'Time (s)')
 
-                        # Link x-axes
-                        if valid_plots > 0:
-                            first_plot_key = f"{device}_{selected_types[0]}"
-                            if first_plot_key in self.plots:
-                                p.setXLink(self.plots[first_plot_key])
+                # Link x-axes to the first plot actually created
+                if first_plot is None:
+                    first_plot = p
+                else:
+                    p.setXLink(first_plot)
 
-                        p.sigRangeChanged.connect(self.on_plot_range_changed)
+                p.sigRangeChanged.connect(self.on_plot_range_changed)
 
-                        self.plots[f"{device}_{data_type}"] = p
-                        self.curves[field_key] = curve
-                        valid_plots += 1
+                self.plots[f"{device}_{data_type}"] = p
+                self.curves[field_key] = curve
+                valid_plots += 1
 
-                # Mark as initialized
-                self.plot_initialized = True
-                self.plot_layout_stable = True
-                print("Streaming plots initialized")  # Debug
+        # Mark as initialized
+        self.plot_initialized = True
+        self.plot_layout_stable = True
 
     def load_selected_script(self):
         """Load the selected script"""
@@ -1972,8 +2340,7 @@ class PowerControllerGUI(QtWidgets.QMainWindow):
         """Clear live data arrays"""
         if self.live_mode:
             self.live_data_points.clear()
-            self.live_times.clear()
-            self.live_channels.clear()
+            self._reset_live_buffers()
             self.all_fields = []
             self.last_data_time = time.time()
             self.data_buffer.clear()  # Clear buffer too
@@ -1981,8 +2348,9 @@ class PowerControllerGUI(QtWidgets.QMainWindow):
             self.plot_initialized = False  # Reset initialization flag
         else:
             self.data_points = []
-            self.times = []
+            self.times = np.empty(0, dtype=np.float64)
             self.channels = {}
+            self._data_version += 1
             self.all_fields = []
             self.current_file_path = None
             self.data_json = None
@@ -1990,33 +2358,72 @@ class PowerControllerGUI(QtWidgets.QMainWindow):
 
         self.schedule_plot_update()
 
+    @property
+    def live_times(self):
+        """View of the buffered live timestamps in seconds"""
+        return self._live_time_buf[self._live_start:self._live_end]
+
+    @property
+    def live_channels(self):
+        """Views of the buffered live channel values keyed by field"""
+        start, end = self._live_start, self._live_end
+        return {field: buf[start:end] for field, buf in self._live_channel_bufs.items()}
+
+    def _reset_live_buffers(self, capacity=1024):
+        """Allocate empty live time/channel buffers"""
+        self._data_version += 1
+        self._live_start = 0
+        self._live_end = 0
+        self._live_time_buf = np.empty(capacity, dtype=np.float64)
+        self._live_channel_bufs = {}  # float64 like the times, created from the first sample's fields
+
+    def _reserve_live_slot(self):
+        """Make room for one more live sample at the end of the buffers"""
+        capacity = len(self._live_time_buf)
+        if self._live_end < capacity:
+            return
+
+        # Reallocate rather than compact in place so views already handed to curves stay intact
+        start, end = self._live_start, self._live_end
+        count = end - start
+        new_capacity = capacity * 2 if count > capacity // 2 else capacity
+
+        def moved(buf):
+            new_buf = np.empty(new_capacity, dtype=buf.dtype)
+            new_buf[:count] = buf[start:end]
+            return new_buf
+
+        self._live_time_buf = moved(self._live_time_buf)
+        self._live_channel_bufs = {field: moved(buf) for field, buf in self._live_channel_bufs.items()}
+        self._live_start, self._live_end = 0, count
+
+    def _drop_oldest_live_sample(self):
+        """Drop the oldest live sample (scroll mode)"""
+        self.live_data_points.popleft()
+        self._live_start += 1
+        self._data_version += 1
+
     def insert_data_by_timestamp(self, new_data_point, new_time):
         """Insert data point in correct timestamp order"""
-        if not self.live_times:
-            self.live_data_points.append(new_data_point)
-            self.live_times.append(new_time)
-            return
+        start, end = self._live_start, self._live_end
 
         # For performance, just append if it's newer than the last point
-        if new_time >= self.live_times[-1]:
+        if end == start or new_time >= self._live_time_buf[end - 1]:
+            self._reserve_live_slot()
+            end = self._live_end
             self.live_data_points.append(new_data_point)
-            self.live_times.append(new_time)
+            self._live_time_buf[end] = new_time
+            for field, buf in self._live_channel_bufs.items():
+                buf[end] = new_data_point.get(field, 0.0)
         else:
             # Find insertion point (rare case)
-            insertion_idx = 0
-            for i, existing_time in enumerate(self.live_times):
-                if new_time <= existing_time:
-                    insertion_idx = i
-                    break
-            else:
-                insertion_idx = len(self.live_times)
-
-            if insertion_idx == len(self.live_times):
-                self.live_data_points.append(new_data_point)
-                self.live_times.append(new_time)
-            else:
-                self.live_data_points.insert(insertion_idx, new_data_point)
-                self.live_times.insert(insertion_idx, new_time)
+            pos = start + int(np.searchsorted(self._live_time_buf[start:end], new_time, side='left'))
+            self.live_data_points.insert(pos - start, new_data_point)
+            self._live_time_buf = np.insert(self._live_time_buf, pos, new_time)
+            for field, buf in self._live_channel_bufs.items():
+                self._live_channel_bufs[field] = np.insert(buf, pos, new_data_point.get(field, 0.0))
+        self._live_end += 1
+        self._data_version += 1
 
     def on_live_data_received(self, data):
         """Handle incoming live data - BUFFERED for smooth updates"""
@@ -2042,10 +2449,12 @@ class PowerControllerGUI(QtWidgets.QMainWindow):
                 if display_name in DEVICES or device_name == 'Total':
                     device_key = display_name if display_name in DEVICES else device_name
 
-                    voltage = float(device_data.get('voltage', 0.0))
-                    current = float(device_data.get('current', 0.0))
-                    power = float(device_data.get('power', 0.0))
-                    state = 1.0 if device_data.get('state', False) else 0.0
+                    # Packet shape is validated by TeensyController._normalize_live_data
+                    voltage = device_data['voltage']
+                    current = device_data['current']
+                    power = device_data['power']
+                    device_state = device_data['state']
+                    state = float(device_state)
 
                     data_point[f"{device_key}_volt"] = voltage
                     data_point[f"{device_key}_curr"] = current
@@ -2056,32 +2465,22 @@ class PowerControllerGUI(QtWidgets.QMainWindow):
                     if display_name in self.device_controls:
                         controls = self.device_controls[display_name]
                         controls['status'].setText(f"{voltage:.1f}V {current:.3f}A")
-
-                        device_state = device_data.get('state', False)
-                        controls['toggle'].blockSignals(True)
-                        controls['toggle'].setChecked(device_state)
-                        if device_state:
-                            controls['toggle'].setText("ON")
-                            controls['toggle'].setStyleSheet(
-                                "QPushButton { background-color: #51cf66; color: white; font-weight: bold; }")
-                        else:
-                            controls['toggle'].setText("OFF")
-                            controls['toggle'].setStyleSheet(
-                                "QPushButton { background-color: #ff6b6b; color: white; font-weight: bold; }")
-                        controls['toggle'].blockSignals(False)
+                        self.set_device_toggle_state(display_name, device_state)
 
             # FIXED: Add to buffer instead of immediate processing
             self.data_buffer.append((data_point, time_sec))
 
             # Update info label less frequently
-            if len(self.data_buffer) % 5 == 0:
+            if not self._last_info_update.isValid() or self._last_info_update.elapsed() >= 500:
+                self._last_info_update.start()
                 num_points = len(self.live_data_points)
-                duration = self.live_times[-1] if self.live_times else 0
+                duration = self.live_times[-1] if num_points else 0
                 self.update_file_info_live(num_points, duration)
 
         except Exception as e:
-            error_msg = f"Error processing live data: {str(e)}"
-            print(f"Full traceback: {traceback.format_exc()}")
+            error_msg = f"Error processing live data: {e!r}"
+            if self.verbose_errors:
+                print(f"Full traceback: {traceback.format_exc()}")
             self.on_error_occurred(error_msg)
 
     def _process_data_buffer(self):
@@ -2089,36 +2488,26 @@ class PowerControllerGUI(QtWidgets.QMainWindow):
         if not self.data_buffer or not self.live_mode:
             return
 
+        data_mode = self._cached_settings['data_mode']
+
         # Process all buffered data
         while self.data_buffer:
             data_point, time_sec = self.data_buffer.popleft()
 
-            # Insert data
-            self.insert_data_by_timestamp(data_point, time_sec)
-
             # Initialize channels if needed
             if not self.all_fields:
                 self.all_fields = [k for k in data_point.keys() if k != 'time']
-                for field in self.all_fields:
-                    self.live_channels[field] = deque()
-
-            # Update channels
-            for field in self.all_fields:
-                if field not in self.live_channels:
-                    self.live_channels[field] = deque()
+                capacity = len(self._live_time_buf)
+                # Same width as the parsed values, so the live statistics see them unrounded
+                self._live_channel_bufs = {field: np.empty(capacity, dtype=np.float64) for field in self.all_fields}
 
-                value = data_point.get(field, 0.0)
-                self.live_channels[field].append(value)
+            # Insert data
+            self.insert_data_by_timestamp(data_point, time_sec)
 
             # Handle data overflow
-            data_mode = self.settings.value("data_mode", 0, int)
             if len(self.live_data_points) > self.max_live_points:
                 if data_mode == 0:  # Scroll mode
-                    self.live_data_points.popleft()
-                    self.live_times.popleft()
-                    for field in self.all_fields:
-                        if len(self.live_channels[field]) > 0:
-                            self.live_channels[field].popleft()
+                    self._drop_oldest_live_sample()
 
         # FIXED: Update plots with incremental data
         if len(self.live_data_points) > 0:
@@ -2126,7 +2515,7 @@ class PowerControllerGUI(QtWidgets.QMainWindow):
 
     def _update_plots_incremental(self):
         """FIXED: Incremental plot updates for smooth animation"""
-        if not self.live_times or not self.live_channels:
+        if self._live_end == self._live_start or not self._live_channel_bufs:
             return
 
         selected_types = self.get_selected_types()
@@ -2146,15 +2535,14 @@ class PowerControllerGUI(QtWidgets.QMainWindow):
         if not self.plot_layout_stable:
             return
 
-        # Apply window mode to get current data window
-        times = list(self.live_times)
-        channels = {}
-        for field, data in self.live_channels.items():
-            channels[field] = list(data)
+        # Apply window mode to get current data window. The live buffers already hold
+        # contiguous float64 channels and times, so these are views, not copies. Curves
+        # get the same values as the statistics; a float32 copy would allocate every tick.
+        times_np = self.live_times
+        channels = self.live_channels
 
         # FIXED: Apply window mode here for incremental updates too
-        times, channels = self.apply_window_mode(times, channels)
-        times_np = np.array(times)
+        times_np, channels = self.apply_window_mode(times_np, channels)
 
         try:
             if current_tab == 0:  # All tab
@@ -2168,8 +2556,9 @@ class PowerControllerGUI(QtWidgets.QMainWindow):
             self.plot_initialized = False
             self.plot_layout_stable = False
 
-    def _update_all_plots_incremental(self, times_np, selected_types):
+    def _update_all_plots_incremental(self, times_np, channels, selected_types):
         """Incrementally update All tab plots"""
+        changed = False
         for data_type in selected_types:
             plot_key = f"all_{data_type}"
             if plot_key not in self.plots:
@@ -2180,52 +2569,65 @@ class PowerControllerGUI(QtWidgets.QMainWindow):
                 field_key = f"{device_key}_{data_type}"
                 curve_key = f"{device}_{data_type}"
 
-                if field_key in self.live_channels and curve_key in self.curves:
-                    y_data = np.array(list(self.live_channels[field_key]))
+                if field_key in channels and curve_key in self.curves:
+                    y_data = np.asarray(channels[field_key])
 
                     if len(y_data) == len(times_np) and len(y_data) > 0:
-                        # Update curve data
-                        curve = self.curves[curve_key]
-                        curve.setData(times_np, y_data)
+                        changed |= self._set_curve_data(curve_key, times_np, y_data)
 
-                        # Update X-axis range only
-                        plot = self.plots[plot_key]
-                        if len(times_np) > 1:
-                            x_min, x_max = times_np[0], times_np[-1]
-                            x_padding = (x_max - x_min) * 0.02
-                            plot.setXRange(x_min - x_padding, x_max + x_padding, padding=0)
+        # X-axes are linked, so one range update on the first plot covers the tab
+        if changed:
+            self._set_linked_x_range([f"all_{t}" for t in selected_types], times_np)
 
-    def _update_device_plots_incremental(self, device, times_np, selected_types):
+    def _update_device_plots_incremental(self, device, times_np, channels, selected_types):
         """Incrementally update device tab plots"""
         device_key = device
+        changed = False
 
         for data_type in selected_types:
             plot_key = f"{device}_{data_type}"
             field_key = f"{device_key}_{data_type}"
 
-            if plot_key in self.plots and field_key in self.curves and field_key in self.live_channels:
-                y_data = np.array(list(self.live_channels[field_key]))
+            if plot_key in self.plots and field_key in self.curves and field_key in channels:
+                y_data = np.asarray(channels[field_key])
 
                 if len(y_data) == len(times_np) and len(y_data) > 0:
-                    # Update curve data
-                    curve = self.curves[field_key]
-                    curve.setData(times_np, y_data)
+                    changed |= self._set_curve_data(field_key, times_np, y_data)
+
+        if changed:
+            self._set_linked_x_range([f"{device}_{t}" for t in selected_types], times_np)
 
-                    # Update X-axis range only
-                    plot = self.plots[plot_key]
-                    if len(times_np) > 1:
-                        x_min, x_max = times_np[0], times_np[-1]
-                        x_padding = (x_max - x_min) * 0.02
-                        plot.setXRange(x_min - x_padding, x_max + x_padding, padding=0)
+    def _set_linked_x_range(self, plot_keys, times_np):
+        """Set the X range on the link master with plot signals blocked to avoid a range-changed cascade"""
+        plots = [self.plots[key] for key in plot_keys if key in self.plots]
+        if not plots or len(times_np) < 2:
+            return
+
+        x_min, x_max = times_np[0], times_np[-1]
+        x_padding = (x_max - x_min) * 0.02
+        for plot in plots:
+            plot.blockSignals(True)
+        try:
+            plots[0].setXRange(x_min - x_padding, x_max + x_padding, padding=0)
+        finally:
+            for plot in plots:
+                plot.blockSignals(False)
+
+    def _set_curve_data(self, curve_key, times_np, y_data):
+        """Push data to a curve unless nothing was appended since its last update"""
+        curve = self.curves[curve_key]
+        state = (curve, len(y_data), times_np[-1])
+        if self._last_plotted.get(curve_key) == state:
+            return False
+
+        self._last_plotted[curve_key] = state
+        curve.setData(x=times_np, y=y_data, connect='all', skipFiniteCheck=True)
+        return True
 
     def update_file_info_live(self, num_points, duration):
         """Update file info for live data"""
-        info_text = f"""<b>Live Data Stream:</b><br>
-Data Points: {num_points:,}<br>
-Duration: {duration:.1f}s<br>
-Connected: {'Yes' if self.teensy.connected else 'No'}"""
-
-        self.file_info_label.setText(info_text)
+        self.file_info_label.setText(
+            self._info_tpl.format(num_points, duration, 'Yes' if self.teensy.connected else 'No'))
 
     def on_status_received(self, status):
         """Handle system status updates"""
@@ -2233,30 +2635,10 @@ Connected: {'Yes' if self.teensy.connected else 'No'}"""
 
         try:
             # Lock status
-            locked = status.get('locked', False)
-            self.lock_btn.blockSignals(True)
-            self.lock_btn.setChecked(locked)
-            if locked:
-                self.lock_btn.setText("LOCKED")
-                self.lock_btn.setStyleSheet(
-                    "QPushButton { background-color: #ff6b6b; color: white; font-weight: bold; min-height: 35px; }")
-            else:
-                self.lock_btn.setText("UNLOCK")
-                self.lock_btn.setStyleSheet("QPushButton { min-height: 35px; font-weight: bold; }")
-            self.lock_btn.blockSignals(False)
+            self.set_lock_button_state(status.get('locked', False))
 
             # Safety stop status
-            safety_stop = status.get('safety_stop', False)
-            self.safety_btn.blockSignals(True)
-            self.safety_btn.setChecked(safety_stop)
-            if safety_stop:
-                self.safety_btn.setText("STOPPED")
-                self.safety_btn.setStyleSheet(
-                    "QPushButton { background-color: #ff4444; color: white; font-weight: bold; min-height: 35px; }")
-            else:
-                self.safety_btn.setText("NORMAL")
-                self.safety_btn.setStyleSheet("QPushButton { min-height: 35px; font-weight: bold; }")
-            self.safety_btn.blockSignals(False)
+            self.set_safety_button_state(status.get('safety_stop', False))
 
             # Update info display
             version = status.get('version', 'Unknown')
@@ -2301,16 +2683,7 @@ Connected: {'Yes' if self.teensy.connected else 'No'}"""
             if not os.access(file_path, os.R_OK):
                 raise PermissionError(f"Cannot read file: {file_path}")
 
-            with open(file_path, "r", encoding='utf-8') as f:
-                file_content = f.read()
-
-            if self.detect_json_corruption(file_content):
-                file_content = self.attempt_json_repair(file_content)
-
-            try:
-                self.data_json = json.loads(file_content)
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Invalid JSON format: {str(e)}")
+            self.data_json = self.read_json_file(file_path)
 
             self.extract_script_info(self.data_json)
             corruption_info = self.validate_and_check_corruption(self.data_json)
@@ -2350,24 +2723,47 @@ Connected: {'Yes' if self.teensy.connected else 'No'}"""
             )
             self.statusBar().showMessage("Failed to load file")
 
+    def read_json_file(self, file_path):
+        """Parse a JSON file, memory-mapping large files when orjson is available"""
+        with open(file_path, "rb") as f:
+            if ORJSON_AVAILABLE and os.fstat(f.fileno()).st_size >= MMAP_MIN_BYTES:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                    return self.parse_json_bytes(view)
+            return self.parse_json_bytes(f.read())
+
+    def parse_json_bytes(self, raw):
+        """Parse raw JSON bytes, repairing common corruption if parsing fails"""
+        try:
+            return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+        except json.JSONDecodeError as e:
+            # Decode to text only when the file needs repairing
+            content = bytes(raw).decode('utf-8')
+            if not self.detect_json_corruption(content):
+                raise ValueError(f"Invalid JSON format: {str(e)}")
+            try:
+                return json.loads(self.attempt_json_repair(content))
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON format: {str(e)}")
+
     def detect_json_corruption(self, content):
         """Detect common JSON corruption patterns"""
+        # Check the end of the file first; only fall back to full scans if it looks intact
+        data_start = content.find('"data":[')
+        if data_start != -1:
+            tail = content[max(data_start, len(content) - 256):]
+            if TRUNCATED_TAIL_RE.search(tail.rstrip().rstrip('}')):
+                return True
         if content.count('{') != content.count('}'):
             return True
         if content.count('[') != content.count(']'):
             return True
-        if re.search(r',\s*[}\]]', content):
+        if TRAILING_COMMA_RE.search(content):
             return True
-        data_start = content.find('"data":[')
-        if data_start != -1:
-            after_data_start = content[data_start:]
-            if re.search(r'[,{]\s*$', after_data_start.rstrip().rstrip('}')):
-                return True
         return False
 
     def attempt_json_repair(self, content):
         """Attempt to repair common JSON corruption issues"""
-        content = re.sub(r',(\s*[}\]])', r'\1', content)
+        content = TRAILING_COMMA_RE.sub(r'\1', content)
         if '"data":[' in content and not content.rstrip().endswith(']}'):
             last_brace = content.rfind('}')
             if last_brace != -1:
@@ -2408,45 +2804,17 @@ Connected: {'Yes' if self.teensy.connected else 'No'}"""
             return corruption_info
         corruption_info['total_points'] = len(data_points)
         self.original_data_points_count = len(data_points)
-        corrupted_indices = []
-        corruption_details = []
-        for i, point in enumerate(data_points):
-            if not isinstance(point, dict):
-                corrupted_indices.append(i)
-                corruption_details.append(f"Point {i}: Not a valid object")
-                continue
-            if 'time' not in point:
-                corrupted_indices.append(i)
-                corruption_details.append(f"Point {i}: Missing 'time' field")
-                continue
-            try:
-                time_val = float(point['time'])
-                if time_val < 0 or not np.isfinite(time_val):
-                    corrupted_indices.append(i)
-                    corruption_details.append(f"Point {i}: Invalid time value: {time_val}")
-                    continue
-            except (ValueError, TypeError):
-                corrupted_indices.append(i)
-                corruption_details.append(f"Point {i}: Time field is not numeric")
-                continue
-            for device in DEVICES:
-                for data_type in DATA_TYPES:
-                    field_key = f"{device}_{data_type}"
-                    if field_key in point:
-                        try:
-                            val = float(point[field_key])
-                            if not np.isfinite(val):
-                                corrupted_indices.append(i)
-                                corruption_details.append(f"Point {i}: Invalid {field_key} value: {val}")
-                                break
-                        except (ValueError, TypeError):
-                            corrupted_indices.append(i)
-                            corruption_details.append(f"Point {i}: {field_key} field is not numeric")
-                            break
-                else:
-                    continue
-                break
-        corrupted_indices = list(dict.fromkeys(corrupted_indices))
+
+        # Flag bad rows column by column instead of checking every field in Python
+        is_dict = np.fromiter((isinstance(p, dict) for p in data_points), dtype=bool, count=len(data_points))
+        rows = data_points if is_dict.all() else [p if isinstance(p, dict) else {} for p in data_points]
+        times_arr = self._numeric_column(rows, 'time', np.nan)
+        bad = ~is_dict | ~(np.isfinite(times_arr) & (times_arr >= 0))
+        for field_key in FIELD_KEYS:
+            bad |= ~np.isfinite(self._numeric_column(rows, field_key, 0.0))
+
+        corrupted_indices = np.flatnonzero(bad).tolist()
+        corruption_details = [self._describe_corruption(i, data_points[i]) for i in corrupted_indices[:10]]
         if corrupted_indices:
             corruption_info['has_corruption'] = True
             corruption_info['corrupted_indices'] = corrupted_indices
@@ -2454,6 +2822,42 @@ Connected: {'Yes' if self.teensy.connected else 'No'}"""
         self.corrupted_indices = corrupted_indices
         return corruption_info
 
+    @staticmethod
+    def _numeric_column(rows, key, default):
+        """Return a field of every row as float64, NaN where it is not numeric"""
+        try:
+            return np.fromiter((p.get(key, default) for p in rows), dtype=np.float64, count=len(rows))
+        except (ValueError, TypeError):
+            column = np.empty(len(rows), dtype=np.float64)
+            for i, p in enumerate(rows):
+                try:
+                    column[i] = float(p.get(key, default))
+                except (ValueError, TypeError):
+                    column[i] = np.nan
+            return column
+
+    def _describe_corruption(self, i, point):
+        """Describe why a data point was flagged as corrupted"""
+        if not isinstance(point, dict):
+            return f"Point {i}: Not a valid object"
+        if 'time' not in point:
+            return f"Point {i}: Missing 'time' field"
+        try:
+            time_val = float(point['time'])
+            if time_val < 0 or not np.isfinite(time_val):
+                return f"Point {i}: Invalid time value: {time_val}"
+        except (ValueError, TypeError):
+            return f"Point {i}: Time field is not numeric"
+        for field_key in FIELD_KEYS:
+            if field_key in point:
+                try:
+                    val = float(point[field_key])
+                    if not np.isfinite(val):
+                        return f"Point {i}: Invalid {field_key} value: {val}"
+                except (ValueError, TypeError):
+                    return f"Point {i}: {field_key} field is not numeric"
+        return f"Point {i}: Invalid data"
+
     def show_corruption_dialog(self, corruption_info):
         """Show dialog asking user if they want to fix corrupted data"""
         num_corrupted = len(corruption_info['corrupted_indices'])
@@ -2490,17 +2894,20 @@ Would you like to:
             backup_path = file_path + ".backup"
             import shutil
             shutil.copy2(file_path, backup_path)
-            data_points = self.data_json['data']
-            for idx in reversed(corruption_info['corrupted_indices']):
-                if 0 <= idx < len(data_points):
-                    del data_points[idx]
+            bad = set(corruption_info['corrupted_indices'])
+            data_points = [p for i, p in enumerate(self.data_json['data']) if i not in bad]
+            self.data_json['data'] = data_points
             if 'duration_sec' in self.data_json:
                 if data_points and len(data_points) > 1:
                     start_time = data_points[0].get('time', 0)
                     end_time = data_points[-1].get('time', 0)
                     self.data_json['duration_sec'] = int((end_time - start_time) / 1000)
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(self.data_json, f, indent=2)
+            if ORJSON_AVAILABLE:
+                with open(file_path, 'wb') as f:
+                    f.write(orjson.dumps(self.data_json, option=orjson.OPT_INDENT_2))
+            else:
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    json.dump(self.data_json, f, indent=2)
             num_removed = len(corruption_info['corrupted_indices'])
             remaining_points = len(data_points)
             QtWidgets.QMessageBox.information(
@@ -2536,31 +2943,33 @@ The file has been automatically reloaded with the cleaned data."""
                 return False
             if "time" not in sample:
                 return False
-            expected_fields = []
-            for device in self.devices:
-                device_key = device
-                for data_type in self.types:
-                    expected_fields.append(f"{device_key}_{data_type}")
-            found_fields = [field for field in expected_fields if field in sample]
-            if len(found_fields) == 0:
-                return False
-            return True
+            return any(field in sample for field in FIELD_KEYS)
         except Exception:
             return False
 
     def process_data(self):
         """Process the loaded JSON data"""
+        self._data_version += 1
         self.data_points = self.data_json["data"]
         sample = self.data_points[0]
         self.all_fields = [k for k in sample.keys() if k != "time"]
-        self.times = [dp["time"] / 1000.0 for dp in self.data_points]
+
+        # Gather every row in a single pass, then split into contiguous columns
+        keys = ("time", *self.all_fields)
+        row_getter = operator.itemgetter(*keys)
+        try:
+            table = np.array([row_getter(dp) for dp in self.data_points], dtype=np.float64)
+        except KeyError:
+            table = np.array([[dp.get(k, np.nan) for k in keys] for dp in self.data_points], dtype=np.float64)
+        columns = np.ascontiguousarray(table.T)
+
+        self.times = columns[0] / 1000.0
         self.channels = {}
-        for k in self.all_fields:
-            data_array = [dp[k] for dp in self.data_points]
+        for j, k in enumerate(self.all_fields, start=1):
+            column = columns[j]
             if k.endswith('_curr'):
-                data_array = [val / 1000.0 for val in data_array]
-            data_array = self.apply_data_filtering(data_array)
-            self.channels[k] = data_array
+                column /= 1000.0
+            self.channels[k] = self.apply_data_filtering(column)
 
     def update_file_info(self):
         """Update the file information display"""
@@ -2582,11 +2991,8 @@ The file has been automatically reloaded with the cleaned data."""
     def get_current_data(self):
         """Get current data arrays based on mode"""
         if self.live_mode:
-            times = list(self.live_times)
-            channels = {}
-            for field, data in self.live_channels.items():
-                filtered_data = self.apply_data_filtering(list(data))
-                channels[field] = filtered_data
+            times = self.live_times
+            channels = {field: self.apply_data_filtering(data) for field, data in self.live_channels.items()}
             return times, channels
         else:
             return self.times, self.channels
@@ -2608,7 +3014,7 @@ The file has been automatically reloaded with the cleaned data."""
         """Update all plot displays - FIXED for stable layout"""
         times, channels = self.get_current_data()
 
-        if not times or not channels:
+        if len(times) == 0 or not channels:
             return
 
         selected_types = self.get_selected_types()
@@ -2628,7 +3034,14 @@ The file has been automatically reloaded with the cleaned data."""
         self.plot_layout_stable = True
 
     def get_device_color(self, device, data_type):
-        """Get color for device from settings"""
+        """Get color for device from settings, cached until settings change"""
+        color = self._color_table.get((device, data_type))
+        if color is None:
+            color = self._color_table[(device, data_type)] = self._read_device_color(device, data_type)
+        return color
+
+    def _read_device_color(self, device, data_type):
+        """Parse the device color stored in settings"""
         color_str = self.settings.value(f"device_color_{device}", "#1f77b4")
         if color_str.startswith('#'):
             hex_color = color_str[1:]
@@ -2641,21 +3054,24 @@ The file has been automatically reloaded with the cleaned data."""
             return DEFAULT_DEVICE_COLORS[data_type][device_index % len(DEFAULT_DEVICE_COLORS[data_type])]
 
     def get_y_range_for_type(self, data_type):
-        """Get Y-axis range for data type from settings"""
-        default_range = DEFAULT_Y_RANGES[data_type]
-        min_val = self.settings.value(f"y_range_{data_type}_min", default_range[0], float)
-        max_val = self.settings.value(f"y_range_{data_type}_max", default_range[1], float)
-        return (min_val, max_val)
+        """Get Y-axis range for data type from settings, cached until settings change"""
+        y_range = self._y_range_table.get(data_type)
+        if y_range is None:
+            default_range = DEFAULT_Y_RANGES[data_type]
+            min_val = self.settings.value(f"y_range_{data_type}_min", default_range[0], float)
+            max_val = self.settings.value(f"y_range_{data_type}_max", default_range[1], float)
+            y_range = self._y_range_table[data_type] = (min_val, max_val)
+        return y_range
 
     def apply_window_mode(self, times, channels):
         """Apply window mode settings to data - FIXED sliding window logic"""
-        window_mode = self.settings.value("window_mode", 0, int)
+        window_mode = self._cached_settings['window_mode']
 
-        if not times or len(times) < 2:
+        if len(times) < 2:
             return times, channels
 
         if window_mode == 0:  # Growing window
-            max_points = self.settings.value("window_max_points", -1, int)
+            max_points = self._cached_settings['window_max_points']
             if max_points > 0 and len(times) > max_points:
                 # Keep only the last max_points
                 times = times[-max_points:]
@@ -2668,11 +3084,11 @@ The file has been automatically reloaded with the cleaned data."""
                 return times, filtered_channels
 
         elif window_mode == 1:  # Sliding time window - FIXED
-            window_duration = self.settings.value("sliding_window_time", 10.0, float)
+            window_duration = self._cached_settings['sliding_window_time']
 
             if len(times) > 1:
                 # Convert times to seconds if they're in milliseconds
-                times_array = np.array(times)
+                times_array = np.asarray(times)
                 if times_array[-1] > 1000:  # Assume milliseconds if last time > 1000
                     times_seconds = times_array / 1000.0
                 else:
@@ -2684,16 +3100,8 @@ The file has been automatically reloaded with the cleaned data."""
                 if (latest_time - times_seconds[0]) > window_duration:
                     cutoff_time = latest_time - window_duration
 
-                    # Find start index - FIXED to use seconds
-                    start_idx = 0
-                    for i, t in enumerate(times_seconds):
-                        if t >= cutoff_time:
-                            start_idx = i
-                            break
-
-                    # Debug output
-                    print(
-                        f"Sliding window: latest={latest_time:.1f}s, cutoff={cutoff_time:.1f}s, start_idx={start_idx}, total_points={len(times)}")
+                    # Find start index - times are sorted, so binary search
+                    start_idx = int(np.searchsorted(times_seconds, cutoff_time, side='left'))
 
                     # Slice data
                     if start_idx > 0:
@@ -2710,32 +3118,36 @@ The file has been automatically reloaded with the cleaned data."""
 
     def update_all_plots(self, times, channels, selected_types):
         """Update the 'All' tab plots with combined device data - FIXED for stability"""
-        if not times or len(times) < 2:
+        if len(times) < 2:
             return
 
         times, channels = self.apply_window_mode(times, channels)
 
+        line_thickness = self._cached_settings['line_thickness']
+        show_grid = self._cached_settings['show_grid']
+        enable_crosshair = self._cached_settings['enable_crosshair'] and self.crosshair_cb.isChecked()
+
+        times_np = np.asarray(times)
+
+        # Same layout as last refresh: push the new data into the existing curves
+        structure_key = (0, tuple(selected_types), line_thickness, show_grid)
+        if structure_key == self._plot_structure_key and self._refresh_all_plots(times_np, channels, selected_types):
+            self._crosshair_data['all'] = self._crosshair_snapshot(
+                times_np, channels, [f"{d}_{t}" for t in selected_types for d in self.devices])
+            return
+
         # FIXED: Clear and rebuild for stable layout
         self.all_plot_widget.clear()
 
         # Clear only All tab plots
-        keys_to_remove = [k for k in self.plots.keys() if k.startswith("all_")]
-        for key in keys_to_remove:
-            del self.plots[key]
-
-        keys_to_remove = [k for k in self.curves.keys() if
-                          any(device in k for device in DEVICES) and any(typ in k for typ in selected_types)]
-        for key in keys_to_remove:
-            if key in self.curves:
-                del self.curves[key]
+        self.plots = {k: v for k, v in self.plots.items() if not k.startswith("all_")}
+        self.curves = {k: v for k, v in self.curves.items()
+                       if not (any(device in k for device in DEVICES) and any(typ in k for typ in selected_types))}
 
         self.clear_crosshairs()
 
-        line_thickness = self.settings.value("line_thickness", 2, int)
-        show_grid = self.settings.value("show_grid", True, bool)
-        enable_crosshair = self.settings.value("enable_crosshair", True, bool) and self.crosshair_cb.isChecked()
-
-        times_np = np.array(times)
+        curve_ranges = self._curve_ranges(times_np, channels,
+                                          [f"{d}_{t}" for t in selected_types for d in self.devices])
 
         # FIXED: Create plots with stable sizing
         for i, data_type in enumerate(selected_types):
@@ -2743,6 +3155,9 @@ The file has been automatically reloaded with the cleaned data."""
 
             # FIXED: Set fixed plot properties to prevent resizing (corrected method)
             p.setContentsMargins(10, 10, 10, 10)
+            # Draw at most one min/max pair per pixel column, and only the visible range
+            p.setDownsampling(auto=True, mode='peak')
+            p.setClipToView(True)
             # Don't set height constraints - let PyQtGraph handle it naturally
 
             p.showGrid(y=show_grid, x=show_grid, alpha=0.3)
@@ -2751,7 +3166,7 @@ The file has been automatically reloaded with the cleaned data."""
                 p.setLabel('bottom', 'Time (s)')
 
             # Collect data for Y-range calculation
-            all_y_data = []
+            y_ranges = []
             valid_devices = []
 
             # Plot each device's data
@@ -2759,43 +3174,24 @@ The file has been automatically reloaded with the cleaned data."""
                 device_key = device
                 field_key = f"{device_key}_{data_type}"
 
-                if field_key in channels and len(channels[field_key]) > 0:
-                    y_data = np.array(channels[field_key])
-
-                    if len(y_data) == len(times_np) and np.any(np.isfinite(y_data)):
-                        color = self.get_device_color(device, data_type)
+                y_range = curve_ranges.get(field_key)
+                if y_range is not None:
+                    color = self.get_device_color(device, data_type)
 
-                        curve = p.plot(
-                            times_np,
-                            y_data,
-                            pen=pg.mkPen(color=color, width=line_thickness),
-                            name=device
-                        )
+                    curve = p.plot(
+                        times_np,
+                        channels[field_key],
+                        pen=pg.mkPen(color=color, width=line_thickness),
+                        name=device
+                    )
 
-                        self.curves[f"{device}_{data_type}"] = curve
+                    self.curves[f"{device}_{data_type}"] = curve
 
-                        finite_data = y_data[np.isfinite(y_data)]
-                        if len(finite_data) > 0:
-                            all_y_data.extend(finite_data)
-                            valid_devices.append(device)
+                    y_ranges.append(y_range)
+                    valid_devices.append(device)
 
             # FIXED: Set Y-axis range with proper scaling
-            if all_y_data:
-                if data_type == 'stat':
-                    p.setYRange(-0.1, 1.1, padding=0)
-                else:
-                    y_min = np.min(all_y_data)
-                    y_max = np.max(all_y_data)
-
-                    y_range = y_max - y_min
-                    if y_range == 0:
-                        y_range = abs(y_max) * 0.1 if y_max != 0 else 1.0
-
-                    padding = y_range * 0.1
-                    p.setYRange(y_min - padding, y_max + padding, padding=0)
-            else:
-                default_range = self.get_y_range_for_type(data_type)
-                p.setYRange(default_range[0], default_range[1], padding=0)
+            self._fit_y_range(p, data_type, y_ranges)
 
             # Set X-axis range
             if len(times_np) > 1:
@@ -2827,10 +3223,77 @@ The file has been automatically reloaded with the cleaned data."""
 
             self.plots[f"all_{data_type}"] = p
 
+        self._plot_structure_key = structure_key
+
         # Add crosshair if enabled
         if selected_types and enable_crosshair:
             self.add_crosshair_to_all_plot(times, channels, selected_types)
 
+    def _refresh_all_plots(self, times_np, channels, selected_types):
+        """Update the existing All tab curves in place; False if the layout has to be rebuilt"""
+        if not all(f"all_{t}" in self.plots for t in selected_types):
+            return False
+
+        curve_ranges = self._curve_ranges(times_np, channels,
+                                          [f"{d}_{t}" for t in selected_types for d in self.devices])
+        for data_type in selected_types:
+            y_ranges = []
+            for device in self.devices:
+                curve_key = f"{device}_{data_type}"
+                y_range = curve_ranges.get(curve_key)
+                if (y_range is not None) != (curve_key in self.curves):
+                    return False
+                if y_range is not None:
+                    self._last_plotted.pop(curve_key, None)
+                    self.curves[curve_key].setData(times_np, channels[curve_key])
+                    y_ranges.append(y_range)
+            self._fit_y_range(self.plots[f"all_{data_type}"], data_type, y_ranges)
+
+        self._set_linked_x_range([f"all_{t}" for t in selected_types], times_np)
+        return True
+
+    def _curve_ranges(self, times_np, channels, field_keys):
+        """Finite (min, max) of every full-length field, computed on the worker pool for large data"""
+        n = len(times_np)
+        arrays = {k: np.asarray(channels[k]) for k in field_keys if k in channels and len(channels[k]) == n}
+        if n * len(arrays) >= PARALLEL_MIN_POINTS:
+            ranges = WORKER_POOL.map(self._finite_range, arrays.values())
+        else:
+            ranges = map(self._finite_range, arrays.values())
+        return {k: r for k, r in zip(arrays, ranges) if r is not None}
+
+    @staticmethod
+    def _finite_range(y_data):
+        """Min and max of the finite values in y_data, or None if it has none"""
+        if len(y_data) == 0:
+            return None
+        # NaN/inf propagate through min/max, so only build a mask when they are present
+        y_min, y_max = y_data.min(), y_data.max()
+        if np.isfinite(y_min) and np.isfinite(y_max):
+            return float(y_min), float(y_max)
+        finite_data = y_data[np.isfinite(y_data)]
+        if len(finite_data) == 0:
+            return None
+        return float(finite_data.min()), float(finite_data.max())
+
+    def _fit_y_range(self, p, data_type, y_ranges):
+        """Fit a plot's Y range to its curves' (min, max) ranges, or fall back to the default range"""
+        if not y_ranges:
+            default_range = self.get_y_range_for_type(data_type)
+            p.setYRange(default_range[0], default_range[1], padding=0)
+        elif data_type == 'stat':
+            p.setYRange(-0.1, 1.1, padding=0)
+        else:
+            y_min = min(r[0] for r in y_ranges)
+            y_max = max(r[1] for r in y_ranges)
+
+            y_range = y_max - y_min
+            if y_range == 0:
+                y_range = abs(y_max) * 0.1 if y_max != 0 else 1.0
+
+            padding = y_range * 0.1
+            p.setYRange(y_min - padding, y_max + padding, padding=0)
+
     def on_plot_range_changed(self):
         """Handle plot range changes to track user interaction"""
         self.user_interacting = True
@@ -2838,48 +3301,56 @@ The file has been automatically reloaded with the cleaned data."""
 
     def update_device_plots(self, device, times, channels, selected_types):
         """Update individual device tab plots - FIXED for stability"""
-        if not times or len(times) < 2:
+        if len(times) < 2:
             return
 
         times, channels = self.apply_window_mode(times, channels)
 
+        device_key = device
+        line_thickness = self._cached_settings['line_thickness']
+        show_grid = self._cached_settings['show_grid']
+        enable_crosshair = self._cached_settings['enable_crosshair'] and self.crosshair_cb.isChecked()
+
+        times_np = np.asarray(times)
+
+        # Same layout as last refresh: push the new data into the existing curves
+        structure_key = (device, tuple(selected_types), line_thickness, show_grid)
+        if (structure_key == self._plot_structure_key
+                and self._refresh_device_plots(device, times_np, channels, selected_types)):
+            self._crosshair_data[device] = self._crosshair_snapshot(
+                times_np, channels, [f"{device}_{t}" for t in selected_types])
+            return
+
         plot_widget = self.device_plot_widgets[device]
         plot_widget.clear()
 
         # Clear device-specific plots
-        keys_to_remove = [k for k in self.plots.keys() if k.startswith(f"{device}_")]
-        for key in keys_to_remove:
-            del self.plots[key]
-
-        keys_to_remove = [k for k in self.curves.keys() if k.startswith(f"{device}_")]
-        for key in keys_to_remove:
-            del self.curves[key]
+        prefix = f"{device}_"
+        self.plots = {k: v for k, v in self.plots.items() if not k.startswith(prefix)}
+        self.curves = {k: v for k, v in self.curves.items() if not k.startswith(prefix)}
 
         self.clear_crosshairs()
 
-        device_key = device
-        line_thickness = self.settings.value("line_thickness", 2, int)
-        show_grid = self.settings.value("show_grid", True, bool)
-        enable_crosshair = self.settings.value("enable_crosshair", True, bool) and self.crosshair_cb.isChecked()
-
-        color_pool = [(31, 119, 180), (255, 127, 14), (44, 160, 44), (214, 39, 40)]
-        times_np = np.array(times)
+        color_pool = DEVICE_PLOT_COLORS
+        curve_ranges = self._curve_ranges(times_np, channels, [f"{device_key}_{t}" for t in selected_types])
 
         valid_plots = 0
+        first_plot = None
         for i, data_type in enumerate(selected_types):
             field_key = f"{device_key}_{data_type}"
 
-            if field_key in channels and len(channels[field_key]) > 0:
-                y_data = np.array(channels[field_key])
-
-                if len(y_data) != len(times_np) or not np.any(np.isfinite(y_data)):
-                    continue
+            y_range = curve_ranges.get(field_key)
+            if y_range is not None:
+                y_data = channels[field_key]
 
                 # Create plot - removed height constraints
                 p = plot_widget.addPlot(row=valid_plots, col=0)
 
                 # FIXED: Set fixed plot properties (removed problematic height setting)
                 p.setContentsMargins(10, 10, 10, 10)
+                # Draw at most one min/max pair per pixel column, and only the visible range
+                p.setDownsampling(auto=True, mode='peak')
+                p.setClipToView(True)
 
                 p.showGrid(y=show_grid, x=show_grid, alpha=0.3)
 
@@ -2893,20 +3364,7 @@ The file has been automatically reloaded with the cleaned data."""
                 )
 
                 # FIXED: Set Y-axis range properly
-                finite_data = y_data[np.isfinite(y_data)]
-                if len(finite_data) > 0:
-                    if data_type == 'stat':
-                        p.setYRange(-0.1, 1.1, padding=0)
-                    else:
-                        y_min = np.min(finite_data)
-                        y_max = np.max(finite_data)
-
-                        y_range = y_max - y_min
-                        if y_range == 0:
-                            y_range = abs(y_max) * 0.1 if y_max != 0 else 1.0
-
-                        padding = y_range * 0.1
-                        p.setYRange(y_min - padding, y_max + padding, padding=0)
+                self._fit_y_range(p, data_type, [y_range])
 
                 # Set X-axis range
                 if len(times_np) > 1:
@@ -2922,11 +3380,11 @@ The file has been automatically reloaded with the cleaned data."""
                 if valid_plots == len([t for t in selected_types if f"{device_key}_{t}" in channels]) - 1:
                     p.setLabel('bottom', 'Time (s)')
 
-                # Link x-axes
-                if valid_plots > 0:
-                    first_plot_key = f"{device}_{selected_types[0]}"
-                    if first_plot_key in self.plots:
-                        p.setXLink(self.plots[first_plot_key])
+                # Link x-axes to the first plot actually created
+                if first_plot is None:
+                    first_plot = p
+                else:
+                    p.setXLink(first_plot)
 
                 p.sigRangeChanged.connect(self.on_plot_range_changed)
 
@@ -2935,10 +3393,58 @@ The file has been automatically reloaded with the cleaned data."""
 
                 valid_plots += 1
 
+        self._plot_structure_key = structure_key
+
         # Add crosshair if enabled
         if valid_plots > 0 and enable_crosshair:
             self.add_crosshair_to_device_plot(device, times, channels, selected_types, color_pool)
 
+    def _refresh_device_plots(self, device, times_np, channels, selected_types):
+        """Update the existing device tab curves in place; False if the layout has to be rebuilt"""
+        plot_keys = []
+        curve_ranges = self._curve_ranges(times_np, channels, [f"{device}_{t}" for t in selected_types])
+        for data_type in selected_types:
+            field_key = f"{device}_{data_type}"
+            y_range = curve_ranges.get(field_key)
+            if (y_range is not None) != (field_key in self.plots and field_key in self.curves):
+                return False
+            if y_range is not None:
+                self._last_plotted.pop(field_key, None)
+                self.curves[field_key].setData(times_np, channels[field_key])
+                self._fit_y_range(self.plots[field_key], data_type, [y_range])
+                plot_keys.append(field_key)
+
+        self._set_linked_x_range(plot_keys, times_np)
+        return True
+
+    @staticmethod
+    def _crosshair_snapshot(times, channels, field_keys):
+        """Arrays read by a crosshair label, limited to the fields it shows, plus the last index lookup"""
+        times_np = np.asarray(times)
+        # Fixed-rate streams map x straight to an index instead of binary searching
+        dt = None
+        if len(times_np) > 1:
+            step = times_np[1] - times_np[0]
+            if step > 0 and np.allclose(np.diff(times_np), step):
+                dt = float(step)
+        return {'times': times_np,
+                'channels': {k: np.asarray(channels[k]) for k in field_keys if k in channels},
+                't0': float(times_np[0]) if dt else 0.0, 'dt': dt,
+                'last_x': None, 'last_idx': 0}
+
+    @staticmethod
+    def _crosshair_index(state, x):
+        """Sample index for a crosshair x position, reusing the previous search when x is unchanged"""
+        if x != state['last_x']:
+            times_np = state['times']
+            if state['dt']:
+                idx = int((x - state['t0']) / state['dt'] + 0.5)
+            else:
+                idx = int(np.searchsorted(times_np, x))
+            state['last_idx'] = max(0, min(idx, len(times_np) - 1))
+            state['last_x'] = x
+        return state['last_idx']
+
     def add_crosshair_to_all_plot(self, times, channels, selected_types):
         """Add crosshair and floating label to the All tab"""
         if not selected_types:
@@ -2968,11 +3474,24 @@ The file has been automatically reloaded with the cleaned data."""
 
         self.crosshair_items[plot_key] = [vLine, hLine, label]
 
-        times_np = np.array(times)
-        show_label = self.settings.value("show_crosshair_label", True, bool)
-
-        def mouseMoved(evt):
-            pos = evt[0]
+        # Read through shared state so in-place plot refreshes also update the crosshair data
+        self._crosshair_data['all'] = self._crosshair_snapshot(
+            times, channels, [f"{d}_{t}" for t in selected_types for d in self.devices])
+        show_label = self._cached_settings['show_crosshair_label']
+        color_hex = {(device, data_type): '#%02x%02x%02x' % self.get_device_color(device, data_type)
+                     for data_type in selected_types for device in self.devices}
+        line_template = CROSSHAIR_LINE_TEMPLATE
+        section_headers = [f"<br><b>{self._type_name_table[data_type]}:</b><br>" for data_type in selected_types]
+        shown = [None, -1]  # Crosshair state and sample index the label text was built for
+        label_bounds = self._crosshair_label_bounds(p0)
+        entries = []  # (section header, [(values, color hex, name), ...]) for the fields present in shown[0]
+
+        def resolve_entries(channels):
+            entries[:] = [(header, [(channels[f"{device}_{data_type}"], color_hex[device, data_type], device)
+                                    for device in self.devices if f"{device}_{data_type}" in channels])
+                          for data_type, header in zip(selected_types, section_headers)]
+
+        def mouseMoved(pos):
             if p0.sceneBoundingRect().contains(pos):
                 mousePoint = p0.vb.mapSceneToView(pos)
                 x = mousePoint.x()
@@ -2984,37 +3503,28 @@ The file has been automatically reloaded with the cleaned data."""
                 hLine.setPos(y)
 
                 if show_label:
-                    idx = np.searchsorted(times_np, x)
-                    if idx >= len(times_np):
-                        idx = len(times_np) - 1
-                    if idx < 0:
-                        idx = 0
-
-                    time_val_sec = times_np[idx]
-                    text = f"<span style='font-size: 12pt'>Time: {time_val_sec:.3f} s</span><br>"
-
-                    for data_type in selected_types:
-                        text += f"<br><b>{self.format_type_name(data_type)}:</b><br>"
-
-                        for j, device in enumerate(self.devices):
-                            device_key = device
-                            field_key = f"{device_key}_{data_type}"
-
-                            if field_key in channels and idx < len(channels[field_key]):
-                                yval = channels[field_key][idx]
-                                color = self.get_device_color(device, data_type)
-                                color_hex = '#%02x%02x%02x' % color
-                                text += f"<span style='color: {color_hex}'>{device}: {yval:.3f}</span><br>"
-
-                    label.setHtml(text)
+                    state = self._crosshair_data['all']
+                    idx = self._crosshair_index(state, x)
+                    # Same sample as the label already shows: only the position changes
+                    if state is not shown[0] or idx != shown[1]:
+                        if state is not shown[0]:
+                            resolve_entries(state['channels'])
+
+                        time_val_sec = state['times'][idx]
+                        parts = [f"<span style='font-size: 12pt'>Time: {time_val_sec:.3f} s</span><br>"]
+
+                        for header, rows in entries:
+                            parts.append(header)
+                            for values, chex, name in rows:
+                                if idx < values.shape[0]:
+                                    parts.append(line_template.format(c=chex, n=name, v=values[idx]))
+
+                        label.setHtml("".join(parts))
+                        shown[:] = [state, idx]
                     label.setVisible(True)
 
-                    view_range = p0.viewRange()
-                    x_range = view_range[0]
-                    y_range = view_range[1]
-
-                    label_x = min(x + (x_range[1] - x_range[0]) * 0.02, x_range[1] - (x_range[1] - x_range[0]) * 0.3)
-                    label_y = max(y, y_range[0] + (y_range[1] - y_range[0]) * 0.1)
+                    label_x = min(x + label_bounds['x_offset'], label_bounds['x_max'])
+                    label_y = max(y, label_bounds['y_min'])
 
                     label.setPos(label_x, label_y)
             else:
@@ -3023,12 +3533,8 @@ The file has been automatically reloaded with the cleaned data."""
                 if show_label:
                     label.setVisible(False)
 
-        for i, data_type in enumerate(selected_types):
-            current_plot_key = f"all_{data_type}"
-            if current_plot_key in self.plots:
-                plot = self.plots[current_plot_key]
-                proxy = pg.SignalProxy(plot.scene().sigMouseMoved, rateLimit=60, slot=mouseMoved)
-                plot._crosshair_proxy = proxy
+        # Every plot of the tab lives in one scene, so a single subscription covers them all
+        self._connect_crosshair(p0.scene(), mouseMoved)
 
     def add_crosshair_to_device_plot(self, device, times, channels, selected_types, color_pool):
         """Add crosshair and floating label to device plot"""
@@ -3058,12 +3564,23 @@ The file has been automatically reloaded with the cleaned data."""
 
         self.crosshair_items[plot_key] = [vLine, hLine, label]
 
-        times_np = np.array(times)
+        # Read through shared state so in-place plot refreshes also update the crosshair data
+        self._crosshair_data[device] = self._crosshair_snapshot(
+            times, channels, [f"{device}_{t}" for t in selected_types])
         device_key = device
-        show_label = self.settings.value("show_crosshair_label", True, bool)
-
-        def mouseMoved(evt):
-            pos = evt[0]
+        show_label = self._cached_settings['show_crosshair_label']
+        color_hex = ['#%02x%02x%02x' % color_pool[i % len(color_pool)] for i in range(len(selected_types))]
+        axis_labels = [self._axis_label_table[device, data_type] for data_type in selected_types]
+        line_template = CROSSHAIR_LINE_TEMPLATE
+        shown = [None, -1]  # Crosshair state and sample index the label text was built for
+        label_bounds = self._crosshair_label_bounds(p0)
+        entries = []  # (values, color hex, name) for the fields present in shown[0]
+
+        def resolve_entries(channels):
+            entries[:] = [(channels[f"{device_key}_{data_type}"], color_hex[i], axis_labels[i])
+                          for i, data_type in enumerate(selected_types) if f"{device_key}_{data_type}" in channels]
+
+        def mouseMoved(pos):
             if p0.sceneBoundingRect().contains(pos):
                 mousePoint = p0.vb.mapSceneToView(pos)
                 x = mousePoint.x()
@@ -3075,32 +3592,29 @@ The file has been automatically reloaded with the cleaned data."""
                 hLine.setPos(y)
 
                 if show_label:
-                    idx = np.searchsorted(times_np, x)
-                    if idx >= len(times_np):
-                        idx = len(times_np) - 1
-                    if idx < 0:
-                        idx = 0
-
-                    time_val_sec = times_np[idx]
-                    text = f"<span style='font-size: 12pt'>Time: {time_val_sec:.3f} s</span><br>"
-
-                    for i, data_type in enumerate(selected_types):
-                        field_key = f"{device_key}_{data_type}"
-                        if field_key in channels and idx < len(channels[field_key]):
-                            yval = channels[field_key][idx]
-                            color = color_pool[i % len(color_pool)]
-                            color_hex = '#%02x%02x%02x' % color
-                            text += f"<span style='color: {color_hex}'>{self.format_axis_label(device, data_type)}: {yval:.3f}</span><br>"
-
-                    label.setHtml(text)
+                    state = self._crosshair_data[device]
+                    idx = self._crosshair_index(state, x)
+                    # Same sample as the label already shows: only the position changes
+                    if state is not shown[0] or idx != shown[1]:
+                        if state is not shown[0]:
+                            resolve_entries(state['channels'])
+
+                        time_val_sec = state['times'][idx]
+                        rows = [(chex, name, values[idx]) for values, chex, name in entries if idx < values.shape[0]]
+
+                        if len(rows) == 1:
+                            # One colored row fits plain text, which skips the HTML parse
+                            chex, name, yval = rows[0]
+                            label.setText(f"Time: {time_val_sec:.3f} s\n{name}: {yval:.3f}", color=chex)
+                        else:
+                            parts = [f"<span style='font-size: 12pt'>Time: {time_val_sec:.3f} s</span><br>"]
+                            parts.extend(line_template.format(c=chex, n=name, v=yval) for chex, name, yval in rows)
+                            label.setHtml("".join(parts))
+                        shown[:] = [state, idx]
                     label.setVisible(True)
 
-                    view_range = p0.viewRange()
-                    x_range = view_range[0]
-                    y_range = view_range[1]
-
-                    label_x = min(x + (x_range[1] - x_range[0]) * 0.02, x_range[1] - (x_range[1] - x_range[0]) * 0.3)
-                    label_y = max(y, y_range[0] + (y_range[1] - y_range[0]) * 0.1)
+                    label_x = min(x + label_bounds['x_offset'], label_bounds['x_max'])
+                    label_y = max(y, label_bounds['y_min'])
 
                     label.setPos(label_x, label_y)
             else:
@@ -3109,12 +3623,8 @@ The file has been automatically reloaded with the cleaned data."""
                 if show_label:
                     label.setVisible(False)
 
-        for i, data_type in enumerate(selected_types):
-            current_plot_key = f"{device}_{data_type}"
-            if current_plot_key in self.plots:
-                plot = self.plots[current_plot_key]
-                proxy = pg.SignalProxy(plot.scene().sigMouseMoved, rateLimit=60, slot=mouseMoved)
-                plot._crosshair_proxy = proxy
+        # Every plot of the tab lives in one scene, so a single subscription covers them all
+        self._connect_crosshair(p0.scene(), mouseMoved)
 
     def toggle_side_panel(self):
         """Toggle the visibility of the side panel"""
@@ -3128,7 +3638,7 @@ The file has been automatically reloaded with the cleaned data."""
         self.clear_side_panel_content()
 
         times, channels = self.get_current_data()
-        if not times:
+        if len(times) == 0:
             return
 
         current_tab = self.plotTabWidget.currentIndex()
@@ -3153,17 +3663,18 @@ The file has been automatically reloaded with the cleaned data."""
             script_data.append(["Connected", "Yes" if self.teensy.connected else "No"])
             script_data.append(["Streaming", "Yes" if self.teensy.streaming else "No"])
         else:
-            script_data.append(["Script Used", "Yes" if self.script_info.get('using_script', 0) else "No"])
-            if self.script_info.get('using_script', 0):
-                script_data.append(["Script Name", self.script_info.get('script_name', 'Unknown')])
-                script_data.append(["Start Time (T_START)", f"{self.script_info.get('t_start', 0)} seconds"])
-                script_data.append(["End Time (T_END)", f"{self.script_info.get('t_end', 0)} seconds"])
-                script_data.append(["Auto Recording", "Yes" if self.script_info.get('auto_record', False) else "No"])
+            si = self.script_info
+            script_data.append(["Script Used", "Yes" if si.get('using_script', 0) else "No"])
+            if si.get('using_script', 0):
+                script_data.append(["Script Name", si.get('script_name', 'Unknown')])
+                script_data.append(["Start Time (T_START)", f"{si.get('t_start', 0)} seconds"])
+                script_data.append(["End Time (T_END)", f"{si.get('t_end', 0)} seconds"])
+                script_data.append(["Auto Recording", "Yes" if si.get('auto_record', False) else "No"])
             else:
                 script_data.append(["Recording Type", "Manual Recording"])
-            script_data.append(["Recording Start", self.script_info.get('timestamp', 'Unknown')])
-            if self.script_info.get('duration_sec', 0) > 0:
-                duration = self.script_info.get('duration_sec', 0)
+            script_data.append(["Recording Start", si.get('timestamp', 'Unknown')])
+            duration = si.get('duration_sec', 0)
+            if duration > 0:
                 script_data.append(["Recording Duration", f"{duration} seconds ({duration / 60:.1f} minutes)"])
 
         script_data.append(["", ""])
@@ -3207,14 +3718,21 @@ The file has been automatically reloaded with the cleaned data."""
         table.setAlternatingRowColors(True)
         table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows)
 
+        header_font = QtGui.QFont(table.font())
+        header_font.setBold(True)
+
+        # Populate without per-item repaints or signals; the table is laid out once at the end
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
         for i, row in enumerate(data):
             for j, cell in enumerate(row):
-                item = QtWidgets.QTableWidgetItem(str(cell))
-                if str(cell).startswith("===") and str(cell).endswith("==="):
-                    font = item.font()
-                    font.setBold(True)
-                    item.setFont(font)
+                text = str(cell)
+                item = QtWidgets.QTableWidgetItem(text)
+                if text.startswith("===") and text.endswith("==="):
+                    item.setFont(header_font)
                 table.setItem(i, j, item)
+        table.blockSignals(False)
+        table.setUpdatesEnabled(True)
 
         table.resizeColumnsToContents()
         self.sidePanelLayout.addWidget(table)
@@ -3228,14 +3746,47 @@ The file has been automatically reloaded with the cleaned data."""
 
     def get_full_device_analysis(self):
         """Generate a comprehensive summary of the data analysis"""
+        # Side panel refreshes and every export format ask for the same analysis
+        cache_key = (self._data_version, self.live_mode)
+        if cache_key == self._analysis_cache_key:
+            return self._analysis_cache
+
+        self._analysis_cache = self._compute_device_analysis()
+        self._analysis_cache_key = cache_key
+        return self._analysis_cache
+
+    @staticmethod
+    def _device_stats(voltages, currents, times_array, dt_hours):
+        """Max/min/mean of voltage, current and power, plus amp hours and watt hours"""
+        # Results are NumPy float64 scalars so round() uses NumPy's rounding, as the reports always have
+        n = len(voltages)
+        if NUMBA_AVAILABLE:
+            (max_v, min_v, sum_v, max_c, min_c, sum_c, max_p, min_p, sum_p,
+             amp_sec, watt_sec) = _device_stats_kernel(voltages, currents, times_array)
+            return tuple(np.float64(value) for value in (
+                max_v, min_v, sum_v / n, max_c, min_c, sum_c / n, max_p, min_p, sum_p / n,
+                amp_sec / 3600.0, watt_sec / 3600.0))
+
+        power_watts = voltages * currents
+        # Trapezoid rule over the sample intervals, which every device shares
+        amp_hours = (dt_hours * (currents[1:] + currents[:-1]) / 2.0).sum() if n > 1 else 0.0
+        watt_hours = (dt_hours * (power_watts[1:] + power_watts[:-1]) / 2.0).sum() if n > 1 else 0.0
+        return (np.max(voltages), np.min(voltages), np.mean(voltages),
+                np.max(currents), np.min(currents), np.mean(currents),
+                np.max(power_watts), np.min(power_watts), np.mean(power_watts),
+                amp_hours, watt_hours)
+
+    def _compute_device_analysis(self):
+        """Per-device and system statistics for the current data"""
         times, channels = self.get_current_data()
 
-        if not times or not self.devices:
+        if len(times) == 0 or not self.devices:
             return {}
 
         data = {}
         time_duration_seconds = times[-1] - times[0] if len(times) > 1 else 0
-        times_array = np.array(times)
+        times_array = np.asarray(times, dtype=np.float64)
+        dt_hours = np.diff(times_array / 3600.0)
 
         for device in self.devices:
             device_key = device
@@ -3247,31 +3798,28 @@ The file has been automatically reloaded with the cleaned data."""
             if volt_key not in channels or curr_key not in channels:
                 continue
 
-            voltages = np.array(channels[volt_key])
-            currents = np.array(channels[curr_key])
+            # Stored channels are float64 ndarrays already, so these are not copies
+            voltages = np.asarray(channels[volt_key])
+            currents = np.asarray(channels[curr_key])
 
             if len(voltages) != len(currents) or len(voltages) != len(times):
                 continue
 
-            power_watts = voltages * currents
-
-            time_hours = times_array / 3600.0
-            amp_hours = np.trapz(currents, time_hours) if len(currents) > 1 else 0.0
-
-            watt_hours = np.trapz(power_watts, time_hours) if len(power_watts) > 1 else 0.0
+            (max_v, min_v, avg_v, max_c, min_c, avg_c,
+             max_p, min_p, avg_p, amp_hours, watt_hours) = self._device_stats(voltages, currents, times_array, dt_hours)
 
             data[device_key] = {
                 "Device": device,
                 "Total Time (s)": round(time_duration_seconds, 2),
-                "Max Voltage (V)": round(np.max(voltages), 3),
-                "Min Voltage (V)": round(np.min(voltages), 3),
-                "Average Voltage (V)": round(np.mean(voltages), 3),
-                "Max Current (A)": round(np.max(currents), 3),
-                "Min Current (A)": round(np.min(currents), 3),
-                "Average Current (A)": round(np.mean(currents), 3),
-                "Max Power (W)": round(np.max(power_watts), 3),
-                "Min Power (W)": round(np.min(power_watts), 3),
-                "Average Power (W)": round(np.mean(power_watts), 3),
+                "Max Voltage (V)": round(max_v, 3),
+                "Min Voltage (V)": round(min_v, 3),
+                "Average Voltage (V)": round(avg_v, 3),
+                "Max Current (A)": round(max_c, 3),
+                "Min Current (A)": round(min_c, 3),
+                "Average Current (A)": round(avg_c, 3),
+                "Max Power (W)": round(max_p, 3),
+                "Min Power (W)": round(min_p, 3),
+                "Average Power (W)": round(avg_p, 3),
                 "Calculated Amp Hours (Ah)": round(amp_hours, 4),
                 "Energy Consumed (Wh)": round(watt_hours, 3),
                 "Total Data Points": len(times),
@@ -3284,18 +3832,17 @@ The file has been automatically reloaded with the cleaned data."""
             device_keys = [key for key in data.keys() if key != "Summary"]
 
             if device_keys:
-                all_max_voltages = [data[dev]["Max Voltage (V)"] for dev in device_keys]
-                all_avg_voltages = [data[dev]["Average Voltage (V)"] for dev in device_keys]
-                all_max_currents = [data[dev]["Max Current (A)"] for dev in device_keys]
-                all_avg_currents = [data[dev]["Average Current (A)"] for dev in device_keys]
-                all_max_powers = [data[dev]["Max Power (W)"] for dev in device_keys]
-                all_avg_powers = [data[dev]["Average Power (W)"] for dev in device_keys]
-                all_amp_hours = [data[dev]["Calculated Amp Hours (Ah)"] for dev in device_keys]
-                all_energy = [data[dev]["Energy Consumed (Wh)"] for dev in device_keys]
-
-                max_current_device = max(device_keys, key=lambda d: data[d]["Max Current (A)"])
-                max_power_device = max(device_keys, key=lambda d: data[d]["Max Power (W)"])
-                max_energy_device = max(device_keys, key=lambda d: data[d]["Energy Consumed (Wh)"])
+                # One row per device, one column per SUMMARY_STAT_FIELDS entry
+                stats = np.array([[data[dev][field] for field in SUMMARY_STAT_FIELDS] for dev in device_keys],
+                                 dtype=np.float64)
+                col_max = dict(zip(SUMMARY_STAT_FIELDS, stats.max(axis=0)))
+                col_mean = dict(zip(SUMMARY_STAT_FIELDS, stats.mean(axis=0)))
+                col_sum = dict(zip(SUMMARY_STAT_FIELDS, stats.sum(axis=0)))
+                col_argmax = dict(zip(SUMMARY_STAT_FIELDS, stats.argmax(axis=0)))
+
+                max_current_device = device_keys[col_argmax["Max Current (A)"]]
+                max_power_device = device_keys[col_argmax["Max Power (W)"]]
+                max_energy_device = device_keys[col_argmax["Energy Consumed (Wh)"]]
 
                 max_total_current = 0.0
                 max_total_power = 0.0
@@ -3303,9 +3850,9 @@ The file has been automatically reloaded with the cleaned data."""
                     curr_key = f"{dev}_curr"
                     pow_key = f"{dev}_pow"
                     if curr_key in channels:
-                        max_total_current = max(max_total_current, np.max(channels[curr_key]))
+                        max_total_current = max(max_total_current, np.float64(np.max(channels[curr_key])))
                     if pow_key in channels:
-                        max_total_power = max(max_total_power, np.max(channels[pow_key]))
+                        max_total_power = max(max_total_power, np.float64(np.max(channels[pow_key])))
 
                 data["Summary"] = {
                     "Analysis Info": {
@@ -3319,28 +3866,28 @@ The file has been automatically reloaded with the cleaned data."""
                                                            2) if time_duration_seconds > 0 else 0
                     },
                     "System Voltage": {
-                        "Maximum (V)": round(np.max(all_max_voltages), 3),
-                        "Average Maximum (V)": round(np.mean(all_max_voltages), 3),
-                        "Overall Average (V)": round(np.mean(all_avg_voltages), 3)
+                        "Maximum (V)": round(col_max["Max Voltage (V)"], 3),
+                        "Average Maximum (V)": round(col_mean["Max Voltage (V)"], 3),
+                        "Overall Average (V)": round(col_mean["Average Voltage (V)"], 3)
                     },
                     "System Current": {
-                        "Maximum (A)": round(np.max(all_max_currents), 3),
+                        "Maximum (A)": round(col_max["Max Current (A)"], 3),
                         "Maximum Total Current (A)": round(max_total_current, 3),
-                        "Average Maximum (A)": round(np.mean(all_max_currents), 3),
-                        "Total Average (A)": round(np.sum(all_avg_currents), 3),
+                        "Average Maximum (A)": round(col_mean["Max Current (A)"], 3),
+                        "Total Average (A)": round(col_sum["Average Current (A)"], 3),
                         "Device with Max Current": data[max_current_device]["Device"]
                     },
                     "System Power": {
-                        "Maximum (W)": round(np.max(all_max_powers), 3),
+                        "Maximum (W)": round(col_max["Max Power (W)"], 3),
                         "Maximum Total Power (W)": round(max_total_power, 3),
-                        "Average Maximum (W)": round(np.mean(all_max_powers), 3),
-                        "Total Average (W)": round(np.sum(all_avg_powers), 3),
+                        "Average Maximum (W)": round(col_mean["Max Power (W)"], 3),
+                        "Total Average (W)": round(col_sum["Average Power (W)"], 3),
                         "Device with Max Power": data[max_power_device]["Device"]
                     },
                     "Energy Analysis": {
-                        "Total Amp Hours (Ah)": round(np.sum(all_amp_hours), 4),
-                        "Total Energy (Wh)": round(np.sum(all_energy), 3),
-                        "Total Energy (kWh)": round(np.sum(all_energy) / 1000.0, 6),
+                        "Total Amp Hours (Ah)": round(col_sum["Calculated Amp Hours (Ah)"], 4),
+                        "Total Energy (Wh)": round(col_sum["Energy Consumed (Wh)"], 3),
+                        "Total Energy (kWh)": round(col_sum["Energy Consumed (Wh)"] / 1000.0, 6),
                         "Device with Most Energy": data[max_energy_device]["Device"]
                     }
                 }
@@ -3357,18 +3904,18 @@ The file has been automatically reloaded with the cleaned data."""
         recent_files.insert(0, file_path)
         recent_files = recent_files[:self.max_recent_files]
         self.settings.setValue("recent_files", recent_files)
-        self.update_recent_files_menu()
 
-    def update_recent_files_menu(self):
+    def update_recent_files_menu(self, check_exists=True):
         """Update the recent files menu"""
         self.recent_menu.clear()
         recent_files = self.settings.value("recent_files", [])
         if not isinstance(recent_files, list):
             recent_files = []
-        existing_files = [f for f in recent_files if os.path.exists(f)]
-        if len(existing_files) != len(recent_files):
-            self.settings.setValue("recent_files", existing_files)
-            recent_files = existing_files
+        if check_exists:
+            existing_files = [f for f in recent_files if os.path.exists(f)]
+            if len(existing_files) != len(recent_files):
+                self.settings.setValue("recent_files", existing_files)
+                recent_files = existing_files
         if recent_files:
             for i, file_path in enumerate(recent_files):
                 action = QtGui.QAction(f"&{i + 1} {os.path.basename(file_path)}", self)
@@ -3387,12 +3934,11 @@ The file has been automatically reloaded with the cleaned data."""
     def clear_recent_files(self):
         """Clear the recent files list"""
         self.settings.setValue("recent_files", [])
-        self.update_recent_files_menu()
 
     def show_save_dialog(self):
         """Show save format selection dialog"""
         times, channels = self.get_current_data()
-        if not times:
+        if len(times) == 0:
             QtWidgets.QMessageBox.warning(self, "No Data",
                                           "No data loaded. Please open a file first or start live streaming.")
             return
@@ -3409,9 +3955,9 @@ The file has been automatically reloaded with the cleaned data."""
         csv_btn.clicked.connect(lambda: self.export_from_dialog(dialog, 'csv'))
         excel_btn.clicked.connect(lambda: self.export_from_dialog(dialog, 'excel'))
         cancel_btn.clicked.connect(dialog.reject)
-        if not (PANDAS_AVAILABLE and OPENPYXL_AVAILABLE):
+        if not EXCEL_EXPORT_AVAILABLE:
             excel_btn.setEnabled(False)
-            excel_btn.setToolTip("Requires pandas and openpyxl")
+            excel_btn.setToolTip("Requires xlsxwriter or openpyxl")
         button_layout = QtWidgets.QHBoxLayout()
         button_layout.addWidget(text_btn)
         button_layout.addWidget(csv_btn)
@@ -3428,7 +3974,7 @@ The file has been automatically reloaded with the cleaned data."""
     def export_analysis(self, format_type):
         """Export analysis data to various formats"""
         times, channels = self.get_current_data()
-        if not times:
+        if len(times) == 0:
             QtWidgets.QMessageBox.warning(
                 self, "No Data",
                 "No data loaded. Please open a file first or start live streaming."
@@ -3441,6 +3987,8 @@ The file has been automatically reloaded with the cleaned data."""
                 "No analysis data available. Please ensure data is properly loaded."
             )
             return
+        # Writers run on the thread pool, so everything they read besides the analysis is captured here
+        context = self._report_context()
         last_dir = self.settings.value("last_export_directory", str(Path.home()))
         if format_type == 'text':
             file_path, _ = QtWidgets.QFileDialog.getSaveFileName(
@@ -3449,7 +3997,8 @@ The file has been automatically reloaded with the cleaned data."""
                 "Text files (*.txt);;All files (*.*)"
             )
             if file_path:
-                self.export_to_text(analysis_data, file_path)
+                self._start_export(lambda data, path: self._write_text_report(data, path, context),
+                                   analysis_data, file_path, "text file")
         elif format_type == 'csv':
             file_path, _ = QtWidgets.QFileDialog.getSaveFileName(
                 self, "Export Analysis to CSV",
@@ -3457,250 +4006,384 @@ The file has been automatically reloaded with the cleaned data."""
                 "CSV files (*.csv);;All files (*.*)"
             )
             if file_path:
-                self.export_to_csv(analysis_data, file_path)
+                self._start_export(lambda data, path: self._write_csv_report(data, path, context),
+                                   analysis_data, file_path, "CSV file")
         elif format_type == 'excel':
-            if not (PANDAS_AVAILABLE and OPENPYXL_AVAILABLE):
+            if not EXCEL_EXPORT_AVAILABLE:
                 QtWidgets.QMessageBox.warning(
                     self, "Missing Dependencies",
-                    "Excel export requires pandas and openpyxl.\nInstall with: pip install pandas openpyxl"
+                    "Excel export requires xlsxwriter or openpyxl.\n"
+                    "Install with: pip install xlsxwriter"
                 )
                 return
             file_path, _ = QtWidgets.QFileDialog.getSaveFileName(
                 self, "Export Analysis to Excel",
                 os.path.join(last_dir, "analysis.xlsx"),
-                "Excel files (*.xlsx);;All files (*.*)"
+                "Excel files (*.xlsx);;CSV sheets in a zip (*.zip);;All files (*.*)"
             )
-            if file_path:
-                self.export_to_excel(analysis_data, file_path)
+            if file_path and file_path.lower().endswith(".zip"):
+                # Same sheets as CSV files, skipping Excel's XML serialization entirely
+                self._start_export(lambda data, path: self._write_csv_zip_report(data, path, context),
+                                   analysis_data, file_path, "zip file")
+            elif file_path:
+                export_hash = self._excel_report_hash(analysis_data, context)
+                if self._excel_export_up_to_date(file_path, export_hash):
+                    self.statusBar().showMessage(f"{file_path} is already up to date")
+                    QtWidgets.QMessageBox.information(
+                        self, "Already up to date",
+                        f"The analysis in:\n{file_path}\nhas not changed since it was exported."
+                    )
+                else:
+                    self._last_export_hash.pop(file_path, None)
+                    self._start_export(
+                        lambda data, path: self._write_excel_report(data, path, context),
+                        analysis_data, file_path, "Excel file",
+                        on_finished=lambda path: self._on_excel_export_finished(path, export_hash))
         if 'file_path' in locals() and file_path:
             self.settings.setValue("last_export_directory", os.path.dirname(file_path))
 
+    def _on_export_finished(self, file_path):
+        """Report a completed analysis export"""
+        self.statusBar().showMessage(f"Analysis exported to {file_path}")
+        QtWidgets.QMessageBox.information(
+            self, "Export Successful",
+            f"Analysis exported to:\n{file_path}"
+        )
+
+    def _on_export_failed(self, description, error):
+        """Report a failed analysis export"""
+        self.statusBar().showMessage("Export failed")
+        QtWidgets.QMessageBox.critical(
+            self, "Export Error",
+            f"Failed to export to {description}:\n{error}"
+        )
+
+    def _on_excel_export_finished(self, file_path, export_hash):
+        """Remember the workbook just written so an unchanged re-export can be skipped"""
+        self._last_export_hash[file_path] = (export_hash, os.stat(file_path).st_mtime_ns)
+        self._warn_missing_lxml()
+
+    def _warn_missing_lxml(self):
+        """Note once that the openpyxl fallback ran without lxml"""
+        if not XLSXWRITER_AVAILABLE and not OPENPYXL_LXML and not self._lxml_warning_shown:
+            print("Warning: lxml not installed, openpyxl falls back to its slower pure-Python XML writer")
+            self._lxml_warning_shown = True
+
+    def _start_export(self, write_report, analysis_data, file_path, description, on_finished=None):
+        """Write an analysis report on the thread pool and report back on the GUI thread"""
+        worker = ExportWorker(write_report, analysis_data, file_path)
+        # Connected before start: a signal emitted with no receiver yet would be lost
+        if on_finished is not None:
+            worker.signals.finished.connect(on_finished)
+        worker.signals.finished.connect(self._on_export_finished)
+        worker.signals.failed.connect(lambda error: self._on_export_failed(description, error))
+        worker.signals.finished.connect(lambda _: self._export_workers.discard(worker))
+        worker.signals.failed.connect(lambda _: self._export_workers.discard(worker))
+        self._export_workers.add(worker)
+        self.statusBar().showMessage(f"Exporting analysis to {os.path.basename(file_path)}...")
+        QtCore.QThreadPool.globalInstance().start(worker)
+
     def export_to_text(self, analysis_data, file_path):
         """Export analysis data to text file"""
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write("Power Data Analysis Report\n")
-                f.write("=" * 50 + "\n")
-                f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                if self.current_file_path:
-                    f.write(f"Source File: {os.path.basename(self.current_file_path)}\n")
-                elif self.live_mode:
-                    f.write("Source: Live Data Stream\n")
-                f.write("\n")
-                f.write("SCRIPT INFORMATION\n")
-                f.write("=" * 30 + "\n")
-                if self.live_mode:
-                    f.write("Mode: Live Data Stream\n")
-                    f.write(f"Connected: {'Yes' if self.teensy.connected else 'No'}\n")
-                    f.write(f"Streaming: {'Yes' if self.teensy.streaming else 'No'}\n")
-                else:
-                    f.write(f"Script Used: {'Yes' if self.script_info.get('using_script', 0) else 'No'}\n")
-                    if self.script_info.get('using_script', 0):
-                        f.write(f"Script Name: {self.script_info.get('script_name', 'Unknown')}\n")
-                        f.write(f"Start Time (T_START): {self.script_info.get('t_start', 0)} seconds\n")
-                        f.write(f"End Time (T_END): {self.script_info.get('t_end', 0)} seconds\n")
-                        f.write(f"Auto Recording: {'Yes' if self.script_info.get('auto_record', False) else 'No'}\n")
-                    else:
-                        f.write("Recording Type: Manual Recording\n")
-                    f.write(f"Recording Start: {self.script_info.get('timestamp', 'Unknown')}\n")
-                    if self.script_info.get('duration_sec', 0) > 0:
-                        duration = self.script_info.get('duration_sec', 0)
-                        f.write(f"Recording Duration: {duration} seconds ({duration / 60:.1f} minutes)\n")
-                f.write("\n")
-                for device_key, data in analysis_data.items():
-                    if device_key == "Summary":
-                        continue
-                    f.write(f"Device: {data.get('Device', device_key)}\n")
-                    f.write("-" * 30 + "\n")
-                    for key, value in data.items():
-                        if key != "Device":
-                            f.write(f"{key}: {value}\n")
-                    f.write("\n")
-                if "Summary" in analysis_data:
-                    f.write("SUMMARY\n")
-                    f.write("=" * 30 + "\n")
-                    for category, category_data in analysis_data["Summary"].items():
-                        f.write(f"\n{category}:\n")
-                        f.write("-" * len(category) + "\n")
-                        if isinstance(category_data, dict):
-                            for key, value in category_data.items():
-                                f.write(f"  {key}: {value}\n")
-                        else:
-                            f.write(f"  {category_data}\n")
-            QtWidgets.QMessageBox.information(
-                self, "Export Successful",
-                f"Analysis exported to:\n{file_path}"
-            )
+            self._write_text_report(analysis_data, file_path, self._report_context())
+            self._on_export_finished(file_path)
         except Exception as e:
-            QtWidgets.QMessageBox.critical(
-                self, "Export Error",
-                f"Failed to export to text file:\n{str(e)}"
-            )
+            self._on_export_failed("text file", str(e))
+
+    def _report_context(self):
+        """Source line and script information rows for a report, read from the GUI state"""
+        if self.current_file_path:
+            source = ("Source File", os.path.basename(self.current_file_path))
+        elif self.live_mode:
+            source = ("Source", "Live Data Stream")
+        else:
+            source = None
+        script_rows = []
+        if self.live_mode:
+            script_rows.append(("Mode", "Live Data Stream"))
+            script_rows.append(("Connected", "Yes" if self.teensy.connected else "No"))
+            script_rows.append(("Streaming", "Yes" if self.teensy.streaming else "No"))
+        else:
+            si = self.script_info
+            script_rows.append(("Script Used", "Yes" if si.get('using_script', 0) else "No"))
+            if si.get('using_script', 0):
+                script_rows.append(("Script Name", si.get('script_name', 'Unknown')))
+                script_rows.append(("Start Time (T_START)", f"{si.get('t_start', 0)} seconds"))
+                script_rows.append(("End Time (T_END)", f"{si.get('t_end', 0)} seconds"))
+                script_rows.append(("Auto Recording", "Yes" if si.get('auto_record', False) else "No"))
+            else:
+                script_rows.append(("Recording Type", "Manual Recording"))
+            script_rows.append(("Recording Start", si.get('timestamp', 'Unknown')))
+            duration = si.get('duration_sec', 0)
+            if duration > 0:
+                script_rows.append(("Recording Duration", f"{duration} seconds ({duration / 60:.1f} minutes)"))
+        return {"source": source, "script_rows": script_rows}
+
+    @staticmethod
+    def _write_text_report(analysis_data, file_path, context):
+        """Write the analysis text file; raises on failure"""
+        lines = []
+        lines.append("Power Data Analysis Report\n")
+        lines.append("=" * 50 + "\n")
+        lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        if context["source"]:
+            lines.append("{}: {}\n".format(*context["source"]))
+        lines.append("\n")
+        lines.append("SCRIPT INFORMATION\n")
+        lines.append("=" * 30 + "\n")
+        lines.extend(f"{key}: {value}\n" for key, value in context["script_rows"])
+        lines.append("\n")
+        for device_key, data in analysis_data.items():
+            if device_key == "Summary":
+                continue
+            lines.append(f"Device: {data.get('Device', device_key)}\n")
+            lines.append("-" * 30 + "\n")
+            for key, value in data.items():
+                if key != "Device":
+                    lines.append(f"{key}: {value}\n")
+            lines.append("\n")
+        if "Summary" in analysis_data:
+            lines.append("SUMMARY\n")
+            lines.append("=" * 30 + "\n")
+            for category, category_data in analysis_data["Summary"].items():
+                lines.append(f"\n{category}:\n")
+                lines.append("-" * len(category) + "\n")
+                if isinstance(category_data, dict):
+                    for key, value in category_data.items():
+                        lines.append(f"  {key}: {value}\n")
+                else:
+                    lines.append(f"  {category_data}\n")
+        # Assemble the report first, then hand it to the file in one write
+        with open(file_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write("".join(lines))
 
     def export_to_csv(self, analysis_data, file_path):
         """Export analysis data to CSV file"""
         try:
-            import csv
-            with open(file_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(["Category", "Parameter", "Value"])
-                if self.live_mode:
-                    writer.writerow(["SCRIPT", "Mode", "Live Data Stream"])
-                    writer.writerow(["SCRIPT", "Connected", "Yes" if self.teensy.connected else "No"])
-                    writer.writerow(["SCRIPT", "Streaming", "Yes" if self.teensy.streaming else "No"])
-                else:
-                    writer.writerow(
-                        ["SCRIPT", "Script Used", "Yes" if self.script_info.get('using_script', 0) else "No"])
-                    if self.script_info.get('using_script', 0):
-                        writer.writerow(["SCRIPT", "Script Name", self.script_info.get('script_name', 'Unknown')])
-                        writer.writerow(
-                            ["SCRIPT", "Start Time (T_START)", f"{self.script_info.get('t_start', 0)} seconds"])
-                        writer.writerow(["SCRIPT", "End Time (T_END)", f"{self.script_info.get('t_end', 0)} seconds"])
-                        writer.writerow(
-                            ["SCRIPT", "Auto Recording", "Yes" if self.script_info.get('auto_record', False) else "No"])
-                    else:
-                        writer.writerow(["SCRIPT", "Recording Type", "Manual Recording"])
-                    writer.writerow(["SCRIPT", "Recording Start", self.script_info.get('timestamp', 'Unknown')])
-                    if self.script_info.get('duration_sec', 0) > 0:
-                        duration = self.script_info.get('duration_sec', 0)
-                        writer.writerow(
-                            ["SCRIPT", "Recording Duration", f"{duration} seconds ({duration / 60:.1f} minutes)"])
-                for device_key, data in analysis_data.items():
-                    if device_key == "Summary":
-                        continue
-                    device_name = data.get('Device', device_key)
-                    for key, value in data.items():
-                        if key != "Device":
-                            writer.writerow([device_name, key, value])
-                if "Summary" in analysis_data:
-                    for category, category_data in analysis_data["Summary"].items():
-                        if isinstance(category_data, dict):
-                            for key, value in category_data.items():
-                                writer.writerow(["SUMMARY", f"{category} - {key}", value])
-                        else:
-                            writer.writerow(["SUMMARY", category, category_data])
-            QtWidgets.QMessageBox.information(
-                self, "Export Successful",
-                f"Analysis exported to:\n{file_path}"
-            )
+            self._write_csv_report(analysis_data, file_path, self._report_context())
+            self._on_export_finished(file_path)
         except Exception as e:
-            QtWidgets.QMessageBox.critical(
-                self, "Export Error",
-                f"Failed to export to CSV file:\n{str(e)}"
-            )
+            self._on_export_failed("CSV file", str(e))
+
+    @staticmethod
+    def _write_csv_report(analysis_data, file_path, context):
+        """Write the analysis CSV file; raises on failure"""
+        import csv
+        rows = []
+        rows.append(["Category", "Parameter", "Value"])
+        rows.extend(["SCRIPT", key, value] for key, value in context["script_rows"])
+        for device_key, data in analysis_data.items():
+            if device_key == "Summary":
+                continue
+            device_name = data.get('Device', device_key)
+            for key, value in data.items():
+                if key != "Device":
+                    rows.append([device_name, key, value])
+        if "Summary" in analysis_data:
+            for category, category_data in analysis_data["Summary"].items():
+                if isinstance(category_data, dict):
+                    for key, value in category_data.items():
+                        rows.append(["SUMMARY", f"{category} - {key}", value])
+                else:
+                    rows.append(["SUMMARY", category, category_data])
+        with open(file_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+            csv.writer(f).writerows(rows)
 
     def export_to_excel(self, analysis_data, file_path):
         """Export analysis data to Excel file"""
         try:
-            with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-                script_data = []
-                if self.live_mode:
-                    script_data.append({"Parameter": "Mode", "Value": "Live Data Stream"})
-                    script_data.append(
-                        {"Parameter": "Connected", "Value": "Yes" if self.teensy.connected else "No"})
-                    script_data.append(
-                        {"Parameter": "Streaming", "Value": "Yes" if self.teensy.streaming else "No"})
-                else:
-                    script_data.append(
-                        {"Parameter": "Script Used",
-                         "Value": "Yes" if self.script_info.get('using_script', 0) else "No"})
-                    if self.script_info.get('using_script', 0):
-                        script_data.append(
-                            {"Parameter": "Script Name", "Value": self.script_info.get('script_name', 'Unknown')})
-                        script_data.append(
-                            {"Parameter": "Start Time (T_START)",
-                             "Value": f"{self.script_info.get('t_start', 0)} seconds"})
-                        script_data.append(
-                            {"Parameter": "End Time (T_END)", "Value": f"{self.script_info.get('t_end', 0)} seconds"})
-                        script_data.append({"Parameter": "Auto Recording",
-                                            "Value": "Yes" if self.script_info.get('auto_record', False) else "No"})
-                    else:
-                        script_data.append({"Parameter": "Recording Type", "Value": "Manual Recording"})
-                    script_data.append(
-                        {"Parameter": "Recording Start", "Value": self.script_info.get('timestamp', 'Unknown')})
-                    if self.script_info.get('duration_sec', 0) > 0:
-                        duration = self.script_info.get('duration_sec', 0)
-                        script_data.append({"Parameter": "Recording Duration",
-                                            "Value": f"{duration} seconds ({duration / 60:.1f} minutes)"})
-                df_script = pd.DataFrame(script_data)
-                df_script.to_excel(writer, sheet_name="Script Info", index=False)
-                for device_key, data in analysis_data.items():
-                    if device_key == "Summary":
-                        continue
-                    df_data = []
-                    device_name = data.get('Device', device_key)
-                    for key, value in data.items():
-                        if key != "Device":
-                            df_data.append({"Parameter": key, "Value": value})
-                    df = pd.DataFrame(df_data)
-                    sheet_name = device_name[:31]
-                    df.to_excel(writer, sheet_name=sheet_name, index=False)
-                if "Summary" in analysis_data:
-                    summary_data = []
-                    for category, category_data in analysis_data["Summary"].items():
-                        if isinstance(category_data, dict):
-                            for key, value in category_data.items():
-                                summary_data.append({
-                                    "Category": category,
-                                    "Parameter": key,
-                                    "Value": value
-                                })
-                        else:
-                            summary_data.append({
-                                "Category": "General",
-                                "Parameter": category,
-                                "Value": category_data
-                            })
-                    df_summary = pd.DataFrame(summary_data)
-                    df_summary.to_excel(writer, sheet_name="Summary", index=False)
-            QtWidgets.QMessageBox.information(
-                self, "Export Successful",
-                f"Analysis exported to:\n{file_path}"
-            )
+            self._last_export_hash.pop(file_path, None)
+            self._write_excel_report(analysis_data, file_path, self._report_context())
+            self._warn_missing_lxml()
+            self._on_export_finished(file_path)
         except Exception as e:
-            QtWidgets.QMessageBox.critical(
-                self, "Export Error",
-                f"Failed to export to Excel file:\n{str(e)}"
-            )
+            self._on_export_failed("Excel file", str(e))
+
+    @staticmethod
+    def _excel_value(value):
+        """Cell value with NaN blanked and infinities as 'inf'/'-inf' text, the way pandas' to_excel wrote them"""
+        if isinstance(value, float) and not math.isfinite(value):
+            return None if value != value else ("inf" if value > 0 else "-inf")
+        return value
+
+    @classmethod
+    def _excel_device_rows(cls, data):
+        """(parameter, value) rows of one device sheet"""
+        excel_value = cls._excel_value
+        return [(key, excel_value(value)) for key, value in data.items() if key != "Device"]
+
+    @classmethod
+    def _excel_report_sheets(cls, analysis_data, context):
+        """(sheet name, column headers, row tuples) for each sheet of the analysis workbook"""
+        sheets = [("Script Info", ("Parameter", "Value"), context["script_rows"])]
+
+        excel_value = cls._excel_value
+        # Excel compares sheet names case-insensitively and cuts them at 31 characters
+        seen_names = {"script info", "summary"}
+        for device_key, data in analysis_data.items():
+            if device_key == "Summary":
+                continue
+            device_name = data.get('Device', device_key)
+            sheet_name = device_name[:31]
+            if sheet_name.lower() in seen_names:
+                sheet_name = device_name[:26] + "_" + hashlib.blake2b(device_name.encode(), digest_size=2).hexdigest()
+            seen_names.add(sheet_name.lower())
+            sheets.append((sheet_name, ("Parameter", "Value"), cls._excel_device_rows(data)))
+
+        if "Summary" in analysis_data:
+            summary_rows = list(itertools.chain.from_iterable(
+                ((category, key, excel_value(value)) for key, value in category_data.items())
+                if isinstance(category_data, dict) else (("General", category, excel_value(category_data)),)
+                for category, category_data in analysis_data["Summary"].items()))
+            sheets.append(("Summary", ("Category", "Parameter", "Value"), summary_rows))
+        return sheets
+
+    def _excel_report_hash(self, analysis_data, context):
+        """Content hash of the workbook the analysis would produce"""
+        sheets = self._excel_report_sheets(analysis_data, context)
+        return hashlib.blake2b(repr(sheets).encode(), digest_size=16).hexdigest()
+
+    def _excel_export_up_to_date(self, file_path, export_hash):
+        """Whether file_path is still the untouched workbook last written with this content"""
+        try:
+            mtime = os.stat(file_path).st_mtime_ns
+        except OSError:
+            return False
+        return self._last_export_hash.get(file_path) == (export_hash, mtime)
+
+    @classmethod
+    def _write_excel_report(cls, analysis_data, file_path, context):
+        """Write the analysis Excel file; raises on failure"""
+        sheets = cls._excel_report_sheets(analysis_data, context)
+        # Both writers emit the zip in many small writes; hand them a 1 MiB buffered handle
+        with open(file_path, 'wb', buffering=1 << 20) as f:
+            if XLSXWRITER_AVAILABLE:
+                # Plain Parameter/Value tables: write rows straight to the workbook, streamed in row order
+                workbook = xlsxwriter.Workbook(f, {'constant_memory': True})
+                try:
+                    # One workbook-level format shared by every sheet's header row
+                    header_format = workbook.add_format({'bold': True})
+                    for sheet_name, columns, rows in sheets:
+                        worksheet = workbook.add_worksheet(sheet_name)
+                        for c, column in enumerate(columns):
+                            worksheet.set_column(c, c, EXCEL_COLUMN_WIDTHS.get(column, 16))
+                        worksheet.write_row(0, 0, columns, header_format)
+                        # Call the typed writers directly instead of write()'s per-cell type dispatch
+                        write_string = worksheet.write_string
+                        write_number = worksheet.write_number
+                        for r, row in enumerate(rows, 1):
+                            for c, value in enumerate(row):
+                                if isinstance(value, str):
+                                    write_string(r, c, value)
+                                elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                                    write_number(r, c, value)
+                                else:
+                                    worksheet.write(r, c, value)
+                finally:
+                    workbook.close()
+            else:
+                # Write-only workbook streams rows out instead of building the worksheet cell model
+                workbook = openpyxl.Workbook(write_only=True)
+                header_font = Font(bold=True)
+                for sheet_name, columns, rows in sheets:
+                    worksheet = workbook.create_sheet(sheet_name)
+                    for c, column in enumerate(columns, 1):
+                        worksheet.column_dimensions[get_column_letter(c)].width = EXCEL_COLUMN_WIDTHS.get(column, 16)
+                    header = [WriteOnlyCell(worksheet, value=column) for column in columns]
+                    for cell in header:
+                        cell.font = header_font
+                    worksheet.append(header)
+                    for row in rows:
+                        worksheet.append(row)
+                workbook.save(f)
+
+    @classmethod
+    def _write_csv_zip_report(cls, analysis_data, file_path, context):
+        """Write each analysis workbook sheet as a CSV file inside a zip; raises on failure"""
+        import csv
+        import io
+        import zipfile
+        with zipfile.ZipFile(file_path, 'w', zipfile.ZIP_DEFLATED) as archive:
+            for sheet_name, columns, rows in cls._excel_report_sheets(analysis_data, context):
+                buffer = io.StringIO()
+                writer = csv.writer(buffer)
+                writer.writerow(columns)
+                writer.writerows(rows)
+                archive.writestr(f"{sheet_name}.csv", buffer.getvalue())
+
+    def _read_ui_setting(self, key):
+        """Stored value of key, in the form save_settings caches it"""
+        value = self.settings.value(key)
+        if key == "splitter_sizes" and isinstance(value, list):
+            # INI-backed QSettings hands list items back as strings; compare as ints like sizes()
+            value = [int(x) for x in value]
+        return value
 
     def load_settings(self):
         """Load application settings"""
-        self.resize(self.settings.value("window_size", QtCore.QSize(1400, 700)))
-        self.move(self.settings.value("window_position", QtCore.QPoint(100, 100)))
-        splitter_sizes = self.settings.value("splitter_sizes", [200, 600, 300])
+        cached = self._settings_cache
+        self.resize(cached.get("window_size", QtCore.QSize(1400, 700)))
+        self.move(cached.get("window_position", QtCore.QPoint(100, 100)))
+        splitter_sizes = cached.get("splitter_sizes", [200, 600, 300])
         if isinstance(splitter_sizes, list) and len(splitter_sizes) == 3:
             self.mainSplitter.setSizes([int(x) for x in splitter_sizes])
-        self.ip_edit.setText(self.settings.value("tcp_ip", "192.168.1.100"))
-        self.tcp_port_edit.setText(self.settings.value("tcp_port", "8080"))
-        self.udp_port_edit.setText(self.settings.value("udp_port", "8081"))
+        self.ip_edit.setText(cached.get("tcp_ip", "192.168.1.100"))
+        self.tcp_port_edit.setText(cached.get("tcp_port", "8080"))
+        self.udp_port_edit.setText(cached.get("udp_port", "8081"))
+        # Shared with the settings dialog, so kept outside the "ui" group
         self.baud_combo.setCurrentText(self.settings.value("serial_baud_rate", "2000000"))
 
         if hasattr(self, 'crosshair_cb'):
-            self.crosshair_cb.setChecked(self.settings.value("enable_crosshair", True, bool))
+            self.crosshair_cb.setChecked(self._cached_settings['enable_crosshair'])
 
     def save_settings(self):
         """Save application settings"""
-        self.settings.setValue("window_size", self.size())
-        self.settings.setValue("window_position", self.pos())
-        self.settings.setValue("splitter_sizes", self.mainSplitter.sizes())
-        self.settings.setValue("tcp_ip", self.ip_edit.text())
-        self.settings.setValue("tcp_port", self.tcp_port_edit.text())
-        self.settings.setValue("udp_port", self.udp_port_edit.text())
+        cached = self._settings_cache
+        cached["window_size"] = self.size()
+        cached["window_position"] = self.pos()
+        cached["splitter_sizes"] = [int(x) for x in self.mainSplitter.sizes()]
+        cached["tcp_ip"] = self.ip_edit.text()
+        cached["tcp_port"] = self.tcp_port_edit.text()
+        cached["udp_port"] = self.udp_port_edit.text()
+        # enable_crosshair is already stored by on_crosshair_changed
         self.settings.setValue("serial_baud_rate", self.baud_combo.currentText())
 
-        if hasattr(self, 'crosshair_cb'):
-            self.settings.setValue("enable_crosshair", self.crosshair_cb.isChecked())
+    def flush_settings(self):
+        """Write settings changed since the last flush back to QSettings on the thread pool"""
+        saved = self._settings_saved
+        changes = {key: value for key, value in self._settings_cache.items()
+                   if key not in saved or saved[key] != value}
+        self._settings_saved = dict(self._settings_cache)
+        if changes:
+            QtCore.QThreadPool.globalInstance().start(SettingsWriter(
+                self.settings.organizationName(), self.settings.applicationName(), UI_SETTINGS_GROUP, changes))
 
     def closeEvent(self, event):
         """Handle application close event"""
+        # A close redelivered while the first one is still shutting down is just accepted
+        if self._closing:
+            event.accept()
+            return
+        self._closing = True
         if self.teensy.connected:
             self.disconnect_from_teensy()
         if self.debug_console:
             self.debug_console.close()
         self.save_settings()
+        self.flush_settings()
+        # Bound shutdown on pending settings and export writes
+        QtCore.QThreadPool.globalInstance().waitForDone(2000)
         event.accept()
 
 
+def _install_icon(app):
+    """Set the application icon if the icon file is present"""
+    icon_path = Path("resources/icons/app_icon.ico")
+    if icon_path.is_file():
+        app.setWindowIcon(QtGui.QIcon(str(icon_path)))
+
+
 def main():
     """Main application entry point"""
     app = QtWidgets.QApplication(sys.argv)
@@ -3708,17 +4391,17 @@ def main():
     app.setApplicationVersion("2.1")
     app.setOrganizationName("TeensyPowerController")
 
-    icon_path = "resources/icons/app_icon.ico"
-    if os.path.exists(icon_path):
-        app.setWindowIcon(QtGui.QIcon(icon_path))
-
     window = PowerControllerGUI()
     window.show()
+    # Icon decode waits until the event loop is running so it does not hold up the first paint
+    QtCore.QTimer.singleShot(0, lambda: _install_icon(app))
 
     if len(sys.argv) > 1:
         default_file = sys.argv[1]
         if os.path.exists(default_file):
-            window.load_file(default_file)
+            # Let the pending show/resize events lay the window out before parsing, then load from the event loop
+            app.processEvents(QtCore.QEventLoop.ProcessEventsFlag.ExcludeUserInputEvents)
+            QtCore.QTimer.singleShot(0, lambda: window.load_file(default_file))
 
     sys.exit(app.exec())
 
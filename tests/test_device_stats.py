@@ -0,0 +1,47 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+import numpy as np
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main
+
+
+@unittest.skipUnless(main.NUMBA_AVAILABLE, "numba is not installed")
+class DeviceStatsKernelTest(unittest.TestCase):
+    """The numba device statistics kernel against the NumPy reductions"""
+
+    def device_stats(self, voltages, currents, times, use_numba):
+        dt_hours = np.diff(times / 3600.0)
+        with mock.patch.object(main, "NUMBA_AVAILABLE", use_numba):
+            return main.PowerControllerGUI._device_stats(voltages, currents, times, dt_hours)
+
+    def assert_kernel_matches_numpy(self, voltages, currents, times):
+        expected = self.device_stats(voltages, currents, times, use_numba=False)
+        actual = self.device_stats(voltages, currents, times, use_numba=True)
+        np.testing.assert_allclose(actual, expected, rtol=1e-12, atol=1e-12)
+
+    def test_matches_numpy(self):
+        rng = np.random.default_rng(0)
+        n = 5000
+        times = np.cumsum(rng.uniform(0.05, 0.15, n))
+        voltages = rng.uniform(0.0, 32.0, n)
+        currents = rng.uniform(-0.01, 2.5, n)
+        self.assert_kernel_matches_numpy(voltages, currents, times)
+
+    def test_single_sample(self):
+        self.assert_kernel_matches_numpy(np.array([28.0]), np.array([1.5]), np.array([10.0]))
+
+    def test_nan_propagates_like_numpy(self):
+        times = np.arange(6, dtype=np.float64)
+        voltages = np.array([28.0, 28.1, np.nan, 28.3, 28.2, 28.0])
+        currents = np.array([1.0, 1.1, 1.2, 1.3, 1.2, 1.1])
+        self.assert_kernel_matches_numpy(voltages, currents, times)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import json
+import os
+import sys
+import unittest
+
+import numpy as np
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from pyqtgraph.Qt import QtWidgets
+
+import main
+
+SAMPLE_FILE = os.path.join(ROOT, "power_data.json")
+
+
+class FileAnalysisTest(unittest.TestCase):
+    """Values shown for a loaded file"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+        cls._message_boxes = {}
+        for name in ("information", "warning", "critical"):
+            cls._message_boxes[name] = getattr(QtWidgets.QMessageBox, name)
+            setattr(QtWidgets.QMessageBox, name, staticmethod(lambda *args, **kwargs: None))
+        with open(SAMPLE_FILE) as f:
+            cls.points = json.load(f)["data"]
+
+    @classmethod
+    def tearDownClass(cls):
+        for name, method in cls._message_boxes.items():
+            setattr(QtWidgets.QMessageBox, name, method)
+
+    def setUp(self):
+        self.window = main.PowerControllerGUI()
+        self.window._cached_settings['enable_filtering'] = False
+        self.window.load_file(SAMPLE_FILE)
+        self.assertEqual(len(self.window.times), len(self.points))
+
+    def tearDown(self):
+        self.window.deleteLater()
+
+    def test_crosshair_reads_parsed_values(self):
+        times, channels = self.window.get_current_data()
+        state = self.window._crosshair_snapshot(times, channels, ["TE-R_volt", "TE-R_curr"])
+        idx = self.window._crosshair_index(state, 300.0)
+
+        self.assertEqual(state['channels']["TE-R_volt"][idx], self.points[idx]["TE-R_volt"])
+        self.assertEqual(state['channels']["TE-R_curr"][idx], self.points[idx]["TE-R_curr"] / 1000.0)
+
+    def test_report_matches_parsed_values(self):
+        analysis = self.window.get_full_device_analysis()
+        voltages = np.array([point["TE-3_volt"] for point in self.points])
+
+        self.assertEqual(analysis["TE-3"]["Max Voltage (V)"], round(voltages.max(), 3))
+        self.assertEqual(analysis["TE-3"]["Min Voltage (V)"], round(voltages.min(), 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
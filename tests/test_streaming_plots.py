@@ -0,0 +1,50 @@
+import os
+import sys
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pyqtgraph.Qt import QtWidgets
+
+import main
+
+
+class StreamingPlotsTest(unittest.TestCase):
+    """Plot setup when streaming starts"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+        cls._message_boxes = {}
+        for name in ("information", "warning", "critical"):
+            cls._message_boxes[name] = getattr(QtWidgets.QMessageBox, name)
+            setattr(QtWidgets.QMessageBox, name, staticmethod(lambda *args, **kwargs: None))
+
+    @classmethod
+    def tearDownClass(cls):
+        for name, method in cls._message_boxes.items():
+            setattr(QtWidgets.QMessageBox, name, method)
+
+    def setUp(self):
+        self.window = main.PowerControllerGUI()
+
+    def tearDown(self):
+        self.window.deleteLater()
+
+    def test_device_tab_plots_link_to_first_plot(self):
+        self.window.plotTabWidget.setCurrentIndex(1)
+        device = self.window.devices[0]
+        selected_types = self.window.get_selected_types()
+
+        self.window._initialize_streaming_plots()
+
+        plots = [self.window.plots[f"{device}_{data_type}"] for data_type in selected_types]
+        self.assertTrue(self.window.plot_initialized)
+        self.assertEqual(len(plots), len(selected_types))
+        for plot in plots[1:]:
+            self.assertIs(plot.getViewBox().linkedView(plot.getViewBox().XAxis), plots[0].getViewBox())
+
+
+if __name__ == "__main__":
+    unittest.main()